@@ -35,15 +35,20 @@ async function walkAndClean(dir, removedPaths) {
 
 export async function cleanPythonArtifacts() {
   const removedPaths = [];
-  const volatilePath = path.join(skillRoot, "scripts", ".last-project-root");
+  const volatilePaths = [
+    path.join(skillRoot, "scripts", ".last-project-root"),
+    path.join(skillRoot, "scripts", ".last-scripts-dir"),
+  ];
 
   if (existsSync(skillRoot)) {
     await walkAndClean(skillRoot, removedPaths);
   }
 
-  if (existsSync(volatilePath)) {
-    await rm(volatilePath, { force: true });
-    removedPaths.push(path.relative(repoRoot, volatilePath));
+  for (const volatilePath of volatilePaths) {
+    if (existsSync(volatilePath)) {
+      await rm(volatilePath, { force: true });
+      removedPaths.push(path.relative(repoRoot, volatilePath));
+    }
   }
 
   return removedPaths.sort();
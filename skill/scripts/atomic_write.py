@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Atomic file replacement helper for Cadence scripts."""
+
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Replace path with payload so readers never see a partial file."""
+
+    # A unique temp file per writer is swapped into place, so an interrupted or concurrent
+    # write never leaves a truncated file. mkstemp creates it 0600, so the target keeps its
+    # existing mode (or gets the umask default) instead.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
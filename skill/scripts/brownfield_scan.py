@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""Shared repository-scan constants for the brownfield intake and documentation scripts."""
+
+from __future__ import annotations
+
+
+# OS metadata files that say nothing about the project.
+SKIP_FILENAMES = frozenset({".DS_Store", "Thumbs.db", "desktop.ini"})
@@ -8,6 +8,7 @@ import json
 import sys
 from pathlib import Path
 
+from ideation_state import load_ideation
 from project_root import resolve_project_root, write_project_root_hint
 
 
@@ -26,27 +27,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def cadence_json_path(project_root: Path) -> Path:
-    return project_root / ".cadence" / "cadence.json"
-
-
-def load_ideation(project_root: Path) -> dict:
-    state_path = cadence_json_path(project_root)
-    if not state_path.exists():
-        return {}
-
-    try:
-        with state_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"INVALID_CADENCE_JSON: {exc} path={state_path}") from exc
-
-    ideation = data.get("ideation", {})
-    if isinstance(ideation, dict):
-        return ideation
-    return {}
-
-
 def main() -> int:
     args = parse_args()
     explicit_project_root = args.project_root.strip() or None
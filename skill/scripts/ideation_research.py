@@ -1028,3 +1028,54 @@ def normalize_ideation_research(
         "topic_index": {key: topic_index[key] for key in sorted(topic_index.keys())},
     }
     return ideation
+
+
+def count_ideation_research(ideation: Any, *, require_topics: bool) -> tuple[int, int, int]:
+    # The (block, topic, entity) counts normalize_ideation_research would report for a payload
+    # it accepts, computed without building normalized structures. Only the structural checks
+    # run here; block/topic/entity relationship rules are left to the normalizer.
+    if not isinstance(ideation, dict):
+        raise ResearchAgendaValidationError("IDEATION_PAYLOAD_MUST_BE_OBJECT")
+
+    agenda_raw = ideation.get("research_agenda")
+    if not isinstance(agenda_raw, dict):
+        if require_topics:
+            raise ResearchAgendaValidationError(
+                "MISSING_RESEARCH_AGENDA: ideation.research_agenda is required when ideation is complete."
+            )
+        return 0, 0, 0
+
+    blocks_raw = agenda_raw.get("blocks")
+    if not isinstance(blocks_raw, list):
+        blocks_raw = []
+
+    topic_count = 0
+    entity_ids: set[str] = set()
+    for raw_block in blocks_raw:
+        topics_raw = raw_block.get("topics") if isinstance(raw_block, dict) else None
+        if not isinstance(topics_raw, list):
+            continue
+        topic_count += len(topics_raw)
+        for raw_topic in topics_raw:
+            if not isinstance(raw_topic, dict):
+                continue
+            refs, _ = _coerce_entity_refs(
+                raw_topic.get("related_entities")
+                or raw_topic.get("entity_ids")
+                or raw_topic.get("entities")
+                or raw_topic.get("entity")
+            )
+            entity_ids.update(refs)
+
+    for raw_entry in _iter_entity_entries(agenda_raw.get("entity_registry")):
+        entry = raw_entry if isinstance(raw_entry, dict) else {"label": raw_entry}
+        label = _string(entry.get("label") or entry.get("name") or entry.get("entity_id") or entry.get("id"))
+        seed = _string(entry.get("entity_id") or entry.get("id") or label)
+        if seed:
+            entity_ids.add(slugify(seed, "entity"))
+
+    if require_topics and topic_count == 0:
+        raise ResearchAgendaValidationError(
+            "RESEARCH_TOPICS_REQUIRED: ideation.research_agenda.blocks must contain at least one topic."
+        )
+    return len(blocks_raw), topic_count, len(entity_ids)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Shared ideation payload reader for Cadence ideation scripts."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+def cadence_json_path(project_root: Path) -> Path:
+    return project_root / ".cadence" / "cadence.json"
+
+
+def load_ideation(project_root: Path) -> dict[str, Any]:
+    state_path = cadence_json_path(project_root)
+    try:
+        data = json.loads(state_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise ValueError(f"INVALID_CADENCE_JSON: {exc} path={state_path}") from exc
+
+    ideation = data.get("ideation", {}) if isinstance(data, dict) else {}
+    if isinstance(ideation, dict):
+        return ideation
+    return {}
@@ -51,6 +51,18 @@ def save_data(project_root: Path, data):
         file.write("\n")
 
 
+def persist_scripts_dir(project_root: Path) -> str:
+    cadence_dir, _ = cadence_paths(project_root)
+    scripts_dir = str(SCRIPT_DIR)
+
+    data = load_data(project_root)
+    state = data.setdefault("state", {})
+    state["cadence-scripts-dir"] = scripts_dir
+    data = reconcile_workflow_state(data, cadence_dir_exists=cadence_dir.exists())
+    save_data(project_root, data)
+    return scripts_dir
+
+
 def main():
     args = parse_args()
     explicit_project_root = args.project_root.strip() or None
@@ -70,13 +82,7 @@ def main():
         print("MISSING_CADENCE_DIR")
         return 1
 
-    scripts_dir = str(SCRIPT_DIR)
-
-    data = load_data(project_root)
-    state = data.setdefault("state", {})
-    state["cadence-scripts-dir"] = scripts_dir
-    data = reconcile_workflow_state(data, cadence_dir_exists=cadence_dir.exists())
-    save_data(project_root, data)
+    scripts_dir = persist_scripts_dir(project_root)
     write_project_root_hint(SCRIPT_DIR, project_root)
 
     print(json.dumps({"status": "ok", "cadence_scripts_dir": scripts_dir}))
@@ -3,7 +3,7 @@
 
 import argparse
 import json
-import subprocess
+import os
 import sys
 from pathlib import Path
 
@@ -21,6 +21,9 @@ ROUTE_GUARD_SCRIPT = SCRIPT_DIR / "assert-workflow-route.py"
 
 
 def run_command(command):
+    # Only the completion route guard shells out, so defer the import off the default path.
+    import subprocess
+
     return subprocess.run(command, capture_output=True, text=True, check=False)
 
 
@@ -74,6 +77,21 @@ def deep_merge(base, patch):
     return merged
 
 
+def read_payload_file(path: Path) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 def parse_payload(args, project_root: Path):
     payload_file_path = None
     if args.file:
@@ -81,7 +99,7 @@ def parse_payload(args, project_root: Path):
         if not payload_file_path.is_absolute():
             payload_file_path = (project_root / payload_file_path).resolve()
         try:
-            payload_text = payload_file_path.read_text(encoding="utf-8")
+            payload_text = read_payload_file(payload_file_path)
         except OSError as exc:
             raise ValueError(f"Unable to read payload file {args.file}: {exc}") from exc
     elif args.json:
@@ -93,7 +111,7 @@ def parse_payload(args, project_root: Path):
 
     try:
         payload = json.loads(payload_text)
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"Invalid JSON payload: {exc}") from exc
 
     if not isinstance(payload, dict):
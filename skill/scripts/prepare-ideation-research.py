@@ -8,7 +8,11 @@ import json
 import sys
 from pathlib import Path
 
-from ideation_research import ResearchAgendaValidationError, normalize_ideation_research
+from ideation_research import (
+    ResearchAgendaValidationError,
+    count_ideation_research,
+    normalize_ideation_research,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,6 +25,14 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Allow empty research agendas (default requires at least one topic)",
     )
+    parser.add_argument(
+        "--counts-only",
+        action="store_true",
+        help=(
+            "Report summary counts without normalizing or rewriting the payload file "
+            "(structural checks only; relationship rules are not validated)"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -44,29 +56,43 @@ def main() -> int:
         print("IDEATION_PAYLOAD_MUST_BE_OBJECT", file=sys.stderr)
         return 2
 
-    try:
-        normalized = normalize_ideation_research(payload, require_topics=not args.allow_empty)
-    except ResearchAgendaValidationError as exc:
-        print(str(exc), file=sys.stderr)
-        return 2
+    if args.counts_only:
+        try:
+            block_count, topic_count, entity_count = count_ideation_research(
+                payload,
+                require_topics=not args.allow_empty,
+            )
+        except ResearchAgendaValidationError as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
+    else:
+        try:
+            normalized = normalize_ideation_research(payload, require_topics=not args.allow_empty)
+        except ResearchAgendaValidationError as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
 
-    try:
-        payload_path.write_text(json.dumps(normalized, indent=4) + "\n", encoding="utf-8")
-    except OSError as exc:
-        print(f"PAYLOAD_WRITE_FAILED: {exc}", file=sys.stderr)
-        return 3
+        try:
+            payload_path.write_text(json.dumps(normalized, indent=4) + "\n", encoding="utf-8")
+        except OSError as exc:
+            print(f"PAYLOAD_WRITE_FAILED: {exc}", file=sys.stderr)
+            return 3
+
+        agenda = normalized.get("research_agenda", {})
+        summary = agenda.get("summary", {}) if isinstance(agenda, dict) else {}
+        block_count = int(summary.get("block_count", 0))
+        topic_count = int(summary.get("topic_count", 0))
+        entity_count = int(summary.get("entity_count", 0))
 
-    agenda = normalized.get("research_agenda", {})
-    summary = agenda.get("summary", {}) if isinstance(agenda, dict) else {}
     print(
         json.dumps(
             {
                 "status": "ok",
                 "path": str(payload_path),
                 "summary": {
-                    "block_count": int(summary.get("block_count", 0)),
-                    "topic_count": int(summary.get("topic_count", 0)),
-                    "entity_count": int(summary.get("entity_count", 0)),
+                    "block_count": block_count,
+                    "topic_count": topic_count,
+                    "entity_count": entity_count,
                 },
             }
         )
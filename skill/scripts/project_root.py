@@ -4,12 +4,34 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
 PROJECT_ROOT_HINT_FILE = ".last-project-root"
 
 
+@lru_cache(maxsize=None)
+def _resolve_absolute(path: Path) -> Path:
+    return path.resolve()
+
+
+def _resolved(path: Path) -> Path:
+    # Relative paths depend on the current cwd, so only absolute ones are memoized.
+    if path.is_absolute():
+        return _resolve_absolute(path)
+    return path.resolve()
+
+
+@lru_cache(maxsize=256)
+def _has_cadence(path: Path) -> bool:
+    # Gate scripts resolve the root once per process, so a memoized stat cannot go stale.
+    try:
+        return (path / ".cadence").is_dir()
+    except OSError:
+        return False
+
+
 def hint_file_path(script_dir: Path) -> Path:
     return script_dir / PROJECT_ROOT_HINT_FILE
 
@@ -17,8 +39,19 @@ def hint_file_path(script_dir: Path) -> Path:
 def write_project_root_hint(script_dir: Path, project_root: Path) -> None:
     """Best-effort write of the most recent Cadence project root."""
     try:
-        hint_path = hint_file_path(script_dir)
-        hint_path.write_text(f"{project_root.resolve()}\n", encoding="utf-8")
+        # Roots from resolve_project_root are already resolved; the hint is re-resolved on read anyway.
+        root = project_root if project_root.is_absolute() else _resolved(project_root)
+        data = f"{root}\n".encode("utf-8")
+        fd = os.open(hint_file_path(script_dir), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # The hint rarely changes between calls; leave the file untouched when it already matches.
+            if os.read(fd, len(data) + 1) == data:
+                return
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, data)
+        finally:
+            os.close(fd)
     except OSError:
         # Hint persistence is convenience only; never fail gate scripts for this.
         return
@@ -34,8 +67,8 @@ def read_project_root_hint(script_dir: Path) -> Path | None:
     if not raw:
         return None
 
-    candidate = Path(raw).expanduser().resolve()
-    if candidate.is_dir() and (candidate / ".cadence").is_dir():
+    candidate = _resolved(Path(raw).expanduser())
+    if candidate.is_dir() and _has_cadence(candidate):
         return candidate
     return None
 
@@ -45,22 +78,25 @@ def read_oldpwd_hint(*, require_cadence: bool = False) -> Path | None:
     if not raw:
         return None
 
-    candidate = Path(raw).expanduser().resolve()
+    candidate = _resolved(Path(raw).expanduser())
     if not candidate.exists() or not candidate.is_dir():
         return None
 
-    if require_cadence and not (candidate / ".cadence").is_dir():
+    if require_cadence and not _has_cadence(candidate):
         return None
 
     return candidate
 
 
-def find_cadence_project_root(start: Path) -> Path | None:
-    current = start.resolve()
-    for candidate in [current, *current.parents]:
-        if (candidate / ".cadence").is_dir():
-            return candidate
-    return None
+def find_cadence_project_root(start: Path, *, already_resolved: bool = False) -> Path | None:
+    current = os.fspath(start if already_resolved else _resolved(start))
+    while True:
+        if os.path.isdir(os.path.join(current, ".cadence")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def resolve_project_root(
@@ -82,20 +118,21 @@ def resolve_project_root(
 
     source = "cwd"
     if explicit_project_root:
-        project_root = Path(explicit_project_root).expanduser().resolve()
+        project_root = _resolved(Path(explicit_project_root).expanduser())
         source = "explicit"
-        skill_root = script_dir.resolve().parent
-        if project_root == skill_root and not (project_root / ".cadence").is_dir():
+        skill_root = _resolved(script_dir).parent
+        if project_root == skill_root and not _has_cadence(project_root):
             raise ValueError(
                 "AMBIGUOUS_PROJECT_ROOT: explicit --project-root resolved to the Cadence skill directory."
             )
     else:
-        cwd = Path.cwd().resolve()
-        project_root = find_cadence_project_root(cwd) or cwd
-        if (project_root / ".cadence").is_dir():
+        cwd = _resolved(Path.cwd())
+        found_root = find_cadence_project_root(cwd, already_resolved=True)
+        project_root = found_root or cwd
+        if found_root is not None:
             source = "cwd"
         elif allow_hint:
-            if cwd == script_dir.resolve().parent:
+            if cwd == _resolved(script_dir).parent:
                 oldpwd_root = read_oldpwd_hint(require_cadence=require_cadence)
                 if oldpwd_root is not None and oldpwd_root != cwd:
                     project_root = oldpwd_root
@@ -117,7 +154,7 @@ def resolve_project_root(
         else:
             source = "cwd-fallback"
 
-    if require_cadence and not (project_root / ".cadence").is_dir():
+    if require_cadence and not _has_cadence(project_root):
         raise ValueError(f"MISSING_CADENCE_DIR: {project_root}")
 
     if not project_root.exists():
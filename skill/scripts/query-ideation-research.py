@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 from difflib import SequenceMatcher
+from functools import lru_cache
 import json
 import re
 import sys
@@ -27,6 +28,7 @@ FUZZY_TEXT_FIELDS: tuple[str, ...] = (
     "topic.keywords",
     "topic.tags",
 )
+_FUZZY_TEXT_FIELDS_SET = frozenset(FUZZY_TEXT_FIELDS)
 TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
 
@@ -78,6 +80,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Include related owner block and linked entity details",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON response for human reading (default: compact)",
+    )
     return parser.parse_args()
 
 
@@ -103,10 +110,10 @@ def resolve_payload_path(args: argparse.Namespace) -> Path:
 
 def read_payload(path: Path) -> tuple[dict[str, Any], str]:
     try:
-        raw_data = json.loads(path.read_text(encoding="utf-8"))
+        raw_data = json.loads(path.read_bytes())
     except OSError as exc:
         raise ValueError(f"PAYLOAD_READ_FAILED: {exc}") from exc
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"INVALID_PAYLOAD_JSON: {exc}") from exc
 
     if not isinstance(raw_data, dict):
@@ -118,6 +125,7 @@ def read_payload(path: Path) -> tuple[dict[str, Any], str]:
 
 
 def _lower(value: Any) -> str:
+    # For CLI input only; normalized agenda fields are already stripped strings and use str.lower().
     return str(value).strip().lower()
 
 
@@ -153,71 +161,103 @@ def _parse_fuzzy_fields(raw_fields: str | None) -> list[str]:
     if not fields:
         raise ValueError("FUZZY_FIELDS_EMPTY")
 
-    invalid_fields = sorted({field for field in fields if field not in FUZZY_TEXT_FIELDS})
+    invalid_fields = sorted({field for field in fields if field not in _FUZZY_TEXT_FIELDS_SET})
     if invalid_fields:
         supported = ", ".join(FUZZY_TEXT_FIELDS)
         invalid = ", ".join(invalid_fields)
         raise ValueError(f"UNKNOWN_FUZZY_FIELDS: {invalid}. Supported fields: {supported}")
 
-    unique_fields: list[str] = []
-    for field in fields:
-        if field not in unique_fields:
-            unique_fields.append(field)
-    return unique_fields
+    return list(dict.fromkeys(fields))
 
 
-def _tokenize(value: str) -> list[str]:
-    return TOKEN_PATTERN.findall(_lower(value))
+@lru_cache(maxsize=4096)
+def _tokenize(value: str) -> tuple[str, ...]:
+    # Block fields recur for every topic in the block; cached tuples are shared, never mutated.
+    return tuple(TOKEN_PATTERN.findall(value.lower()))
 
 
-def _token_overlap_ratio(query: str, candidate: str) -> float:
-    query_tokens = set(_tokenize(query))
-    candidate_tokens = set(_tokenize(candidate))
-    if not query_tokens or not candidate_tokens:
+def _token_overlap_ratio(query_tokens: tuple[str, ...], candidate_tokens: tuple[str, ...]) -> float:
+    query_token_set = set(query_tokens)
+    candidate_token_set = set(candidate_tokens)
+    if not query_token_set or not candidate_token_set:
         return 0.0
-    return len(query_tokens & candidate_tokens) / float(len(query_tokens))
+    return len(query_token_set & candidate_token_set) / float(len(query_token_set))
 
 
-def _fuzzy_score(query: str, candidate: str) -> float:
-    query_norm = _lower(query)
-    candidate_norm = _lower(candidate)
+def _fuzzy_score(
+    query_norm: str,
+    query_tokens: tuple[str, ...],
+    candidate: str,
+    candidate_tokens: tuple[str, ...] | None = None,
+    *,
+    threshold: float = 0.0,
+) -> float:
+    candidate_norm = candidate.lower()
     if not query_norm or not candidate_norm:
         return 0.0
     if query_norm in candidate_norm:
         return 1.0
 
-    best = max(
-        SequenceMatcher(None, query_norm, candidate_norm).ratio(),
-        _token_overlap_ratio(query_norm, candidate_norm),
-    )
+    if candidate_tokens is None:
+        candidate_tokens = _tokenize(candidate_norm)
+
+    # One matcher per candidate: the query stays as seq1 and each phrase only swaps seq2.
+    matcher = SequenceMatcher(None, query_norm, candidate_norm)
+    best = max(matcher.ratio(), _token_overlap_ratio(query_tokens, candidate_tokens))
+
+    if best >= 1.0:
+        return best
 
-    candidate_tokens = _tokenize(candidate_norm)
-    query_token_count = max(1, len(_tokenize(query_norm)))
+    query_token_count = max(1, len(query_tokens))
     max_span = min(len(candidate_tokens), max(query_token_count + 1, 3))
+    seen_phrases: set[str] = set()
     for span in range(1, max_span + 1):
         for start in range(0, len(candidate_tokens) - span + 1):
             phrase = " ".join(candidate_tokens[start : start + span])
-            score = SequenceMatcher(None, query_norm, phrase).ratio()
+            if phrase in seen_phrases:
+                continue
+            seen_phrases.add(phrase)
+            matcher.set_seq2(phrase)
+            # Scores below the threshold are never reported, so a phrase only needs a full
+            # ratio() when its cheap upper bounds could beat both best and the threshold.
+            floor = best if best > threshold else threshold
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
             if score > best:
                 best = score
     return best
 
 
 def _fuzzy_text_match(
-    query: str,
-    entry: dict[str, Any],
+    query_norm: str,
+    query_tokens: tuple[str, ...],
+    field_texts: dict[str, str],
+    field_tokens: dict[str, tuple[str, ...]],
     *,
     threshold: float,
     fields: list[str],
+    score_cache: dict[str, float] | None = None,
 ) -> tuple[bool, float, list[str]]:
-    field_map = _entry_field_map(entry)
     target_fields = fields or list(FUZZY_TEXT_FIELDS)
 
     best_score = 0.0
     matched_fields: list[str] = []
     for field in target_fields:
-        candidate = field_map.get(field, "")
-        score = _fuzzy_score(query, candidate)
+        candidate = field_texts.get(field, "")
+        if score_cache is None:
+            score = _fuzzy_score(query_norm, query_tokens, candidate, field_tokens.get(field), threshold=threshold)
+        else:
+            score = score_cache.get(candidate)
+            if score is None:
+                score = _fuzzy_score(
+                    query_norm,
+                    query_tokens,
+                    candidate,
+                    field_tokens.get(field),
+                    threshold=threshold,
+                )
+                score_cache[candidate] = score
         if score > best_score:
             best_score = score
         if score >= threshold:
@@ -226,7 +266,8 @@ def _fuzzy_text_match(
     return best_score >= threshold, best_score, sorted(set(matched_fields))
 
 
-def _searchable_text(block: dict[str, Any], topic: dict[str, Any]) -> str:
+def _searchable_fields(entry: dict[str, Any]) -> list[str]:
+    topic = entry["topic"]
     fields = [
         topic.get("title", ""),
         topic.get("category", ""),
@@ -234,34 +275,51 @@ def _searchable_text(block: dict[str, Any], topic: dict[str, Any]) -> str:
         " ".join(topic.get("research_questions", []) or []),
         " ".join(topic.get("keywords", []) or []),
         " ".join(topic.get("tags", []) or []),
-        block.get("title", ""),
-        block.get("rationale", ""),
-        " ".join(block.get("tags", []) or []),
+        entry["block_title"],
+        entry["block_rationale"],
+        " ".join(entry["block_tags"]),
     ]
-    return " ".join(str(value) for value in fields).lower()
+    return [str(value).lower() for value in fields]
 
 
-def _resolve_entity_id(raw_entity: str, entity_registry: list[dict[str, Any]]) -> tuple[str, list[str]]:
-    requested = _lower(raw_entity)
-    requested_slug = slugify(requested, requested)
+def _text_matches(needle: str, fields: list[str]) -> bool:
+    # Fields are searched as if space-joined. A needle without a space cannot straddle a
+    # field boundary, so it is checked per field without building the joined string.
+    if " " in needle:
+        return needle in " ".join(fields)
+    return any(needle in field for field in fields)
 
-    by_id: dict[str, dict[str, Any]] = {entry.get("entity_id", ""): entry for entry in entity_registry}
-    if requested_slug in by_id:
-        return requested_slug, []
 
-    alias_matches: list[str] = []
+def _entity_alias_map(entity_registry: list[dict[str, Any]]) -> dict[str, list[str]]:
+    alias_to_ids: dict[str, list[str]] = {}
     for entry in entity_registry:
         entity_id = entry.get("entity_id", "")
-        labels = [entry.get("label", ""), *list(entry.get("aliases", []) or [])]
-        normalized = {_lower(label) for label in labels if str(label).strip()}
-        if requested in normalized:
-            alias_matches.append(entity_id)
-
-    unique_matches = sorted({match for match in alias_matches if match})
-    if len(unique_matches) == 1:
-        return unique_matches[0], []
-    if len(unique_matches) > 1:
-        return "", unique_matches
+        if not entity_id:
+            continue
+        for label in (entry.get("label", ""), *(entry.get("aliases", []) or [])):
+            if not label:
+                continue
+            entity_ids = alias_to_ids.setdefault(label.lower(), [])
+            if entity_id not in entity_ids:
+                entity_ids.append(entity_id)
+    return alias_to_ids
+
+
+def _resolve_entity_id(
+    raw_entity: str,
+    entity_ids: set[str],
+    alias_to_ids: dict[str, list[str]],
+) -> tuple[str, list[str]]:
+    requested = _lower(raw_entity)
+    requested_slug = slugify(requested, requested)
+    if requested_slug in entity_ids:
+        return requested_slug, []
+
+    alias_matches = alias_to_ids.get(requested, [])
+    if len(alias_matches) == 1:
+        return alias_matches[0], []
+    if len(alias_matches) > 1:
+        return "", sorted(alias_matches)
     return "", []
 
 
@@ -310,7 +368,11 @@ def main() -> int:
     entity_filter_id = ""
     ambiguous_entities: list[str] = []
     if args.entity:
-        entity_filter_id, ambiguous_entities = _resolve_entity_id(args.entity, entity_registry)
+        entity_filter_id, ambiguous_entities = _resolve_entity_id(
+            args.entity,
+            {entry.get("entity_id", "") for entry in entity_registry},
+            _entity_alias_map(entity_registry),
+        )
         if ambiguous_entities:
             print(
                 json.dumps(
@@ -338,75 +400,128 @@ def main() -> int:
             return 2
 
     flat_topics: list[dict[str, Any]] = []
+    # Inverted indexes (normalized value -> flat_topics positions), built only for active filters.
+    by_entity: dict[str, list[int]] = {}
+    by_category: dict[str, list[int]] = {}
+    by_priority: dict[str, list[int]] = {}
+    by_tag: dict[str, list[int]] = {}
+    # Recorded during flattening so the block pass below does not re-walk raw blocks.
+    block_entries: list[tuple[str, dict[str, Any], list[Any]]] = []
+    blocks_by_id: dict[str, dict[str, Any]] = {}
+    # Column views of the flattened topics for the block/topic id filters.
+    block_id_column: list[str] = []
+    topic_id_column: list[str] = []
     for block in blocks:
         if not isinstance(block, dict):
             continue
         block_id = str(block.get("block_id", "")).strip()
-        topics = block.get("topics", []) if isinstance(block.get("topics"), list) else []
+        topics = block.get("topics")
+        if not isinstance(topics, list):
+            topics = []
+        # Block-level fields are shared by every topic in the block, so read them once.
+        block_title = block.get("title", "")
+        block_rationale = block.get("rationale", "")
+        block_tags = block.get("tags", []) or []
+        block_tag_values = {tag.lower() for tag in block_tags} if args.tag else set()
+        block_entries.append((block_id, block, topics))
+        blocks_by_id.setdefault(block_id, block)
         for topic in topics:
             if not isinstance(topic, dict):
                 continue
-            flat_topics.append(
-                {
-                    "block_id": block_id,
-                    "block_title": block.get("title", ""),
-                    "block_rationale": block.get("rationale", ""),
-                    "block_tags": list(block.get("tags", []) or []),
-                    "topic": topic,
-                }
-            )
+            topic_id = str(topic.get("topic_id", "")).strip()
+            index = len(flat_topics)
+            block_id_column.append(block_id)
+            topic_id_column.append(topic_id)
+            if entity_filter_id:
+                for entity_id in dict.fromkeys(topic.get("related_entities") or ()):
+                    by_entity.setdefault(entity_id, []).append(index)
+            if args.category:
+                by_category.setdefault(topic.get("category", "").lower(), []).append(index)
+            if args.priority:
+                by_priority.setdefault(topic.get("priority", "").lower(), []).append(index)
+            if args.tag:
+                tag_values = block_tag_values.union(tag.lower() for tag in topic.get("tags") or ())
+                for tag_value in tag_values:
+                    by_tag.setdefault(tag_value, []).append(index)
+            entry = {
+                "block_id": block_id,
+                "block_title": block_title,
+                "block_rationale": block_rationale,
+                "block_tags": block_tags,
+                "topic": topic,
+            }
+            flat_topics.append(entry)
 
     matched_topics: list[dict[str, Any]] = []
     fuzzy_match_meta: dict[str, dict[str, Any]] = {}
-    for entry in flat_topics:
+    # Block fields repeat for every topic in the block, so score each distinct text once.
+    fuzzy_score_cache: dict[str, float] = {}
+    text_query = _lower(args.text) if args.text else ""
+    text_query_tokens = _tokenize(text_query)
+    category_filter = _lower(args.category) if args.category else ""
+    priority_filter = _lower(args.priority) if args.priority else ""
+    tag_filter = _lower(args.tag) if args.tag else ""
+
+    indexed_matches: list[list[int]] = []
+    if block_filter:
+        indexed_matches.append([index for index, value in enumerate(block_id_column) if value == block_filter])
+    if topic_filter:
+        indexed_matches.append([index for index, value in enumerate(topic_id_column) if value == topic_filter])
+    if entity_filter_id:
+        indexed_matches.append(by_entity.get(entity_filter_id, []))
+    if args.category:
+        indexed_matches.append(by_category.get(category_filter, []))
+    if args.priority:
+        indexed_matches.append(by_priority.get(priority_filter, []))
+    if args.tag:
+        indexed_matches.append(by_tag.get(tag_filter, []))
+    if indexed_matches:
+        candidate_indices = set(indexed_matches[0]).intersection(*indexed_matches[1:])
+        candidate_topics = [flat_topics[index] for index in sorted(candidate_indices)]
+    else:
+        candidate_topics = flat_topics
+
+    fuzzy_target_fields = fuzzy_fields or list(FUZZY_TEXT_FIELDS)
+
+    # Text views are built only for entries that survived the indexed filters, and only the
+    # view the active --text mode needs.
+    for entry in candidate_topics:
         topic = entry["topic"]
         topic_id = str(topic.get("topic_id", "")).strip()
-
-        if block_filter and entry["block_id"] != block_filter:
-            continue
-        if topic_filter and topic_id != topic_filter:
-            continue
-        if entity_filter_id and entity_filter_id not in list(topic.get("related_entities", []) or []):
-            continue
-        if args.category and _lower(topic.get("category")) != _lower(args.category):
-            continue
-        if args.priority and _lower(topic.get("priority")) != _lower(args.priority):
-            continue
-        if args.tag:
-            tag_value = _lower(args.tag)
-            topic_tags = {_lower(tag) for tag in list(topic.get("tags", []) or [])}
-            block_tags = {_lower(tag) for tag in entry["block_tags"]}
-            if tag_value not in topic_tags and tag_value not in block_tags:
+        if args.text and args.fuzzy_text:
+            field_texts = _entry_field_map(entry)
+            field_tokens = {field: _tokenize(field_texts[field]) for field in fuzzy_target_fields}
+            is_match, score, matched_fields = _fuzzy_text_match(
+                text_query,
+                text_query_tokens,
+                field_texts,
+                field_tokens,
+                threshold=args.fuzzy_threshold,
+                fields=fuzzy_fields,
+                score_cache=fuzzy_score_cache,
+            )
+            if not is_match:
+                continue
+            fuzzy_match_meta[topic_id] = {
+                "score": round(score, 4),
+                "matched_fields": matched_fields,
+            }
+        elif args.text:
+            if not _text_matches(text_query, _searchable_fields(entry)):
                 continue
-        if args.text:
-            if args.fuzzy_text:
-                is_match, score, matched_fields = _fuzzy_text_match(
-                    args.text,
-                    entry,
-                    threshold=args.fuzzy_threshold,
-                    fields=fuzzy_fields,
-                )
-                if not is_match:
-                    continue
-                fuzzy_match_meta[topic_id] = {
-                    "score": round(score, 4),
-                    "matched_fields": matched_fields,
-                }
-            else:
-                if _lower(args.text) not in _searchable_text(
-                    {
-                        "title": entry["block_title"],
-                        "rationale": entry["block_rationale"],
-                        "tags": entry["block_tags"],
-                    },
-                    topic,
-                ):
-                    continue
 
         matched_topics.append(entry)
 
-    matched_topic_ids = {entry["topic"].get("topic_id", "") for entry in matched_topics}
-    matched_block_ids = {entry["block_id"] for entry in matched_topics}
+    # Matched topics grouped by block in agenda order; the block pass reads these directly.
+    matched_topics_by_block: dict[str, list[dict[str, Any]]] = {}
+    entities_to_include: set[str] = set()
+    if entity_filter_id:
+        entities_to_include.add(entity_filter_id)
+    for entry in matched_topics:
+        topic = entry["topic"]
+        matched_topics_by_block.setdefault(entry["block_id"], []).append(topic)
+        entities_to_include.update(topic.get("related_entities") or ())
+
     topic_level_filter_active = bool(
         topic_filter
         or entity_filter_id
@@ -417,20 +532,13 @@ def main() -> int:
     )
 
     blocks_result: list[dict[str, Any]] = []
-    for block in blocks:
-        if not isinstance(block, dict):
-            continue
-        block_id = str(block.get("block_id", "")).strip()
-
+    for block_id, block, block_topics in block_entries:
         if block_filter and block_id != block_filter:
             continue
-        if not block_filter and block_id not in matched_block_ids and matched_topics:
+        if not block_filter and block_id not in matched_topics_by_block and matched_topics:
             continue
 
-        block_topics = block.get("topics", []) if isinstance(block.get("topics"), list) else []
-        filtered_topics = [
-            topic for topic in block_topics if str(topic.get("topic_id", "")).strip() in matched_topic_ids
-        ]
+        filtered_topics = matched_topics_by_block.get(block_id, [])
 
         if not matched_topics and block_filter:
             if topic_level_filter_active:
@@ -444,7 +552,7 @@ def main() -> int:
             "block_id": block_id,
             "title": block.get("title", ""),
             "rationale": block.get("rationale", ""),
-            "tags": list(block.get("tags", []) or []),
+            "tags": block.get("tags", []) or [],
             "topics": filtered_topics,
         }
         blocks_result.append(block_payload)
@@ -455,27 +563,22 @@ def main() -> int:
         if isinstance(entry, dict) and str(entry.get("entity_id", "")).strip()
     }
 
-    entities_to_include: set[str] = set()
-    if entity_filter_id:
-        entities_to_include.add(entity_filter_id)
-    for entry in matched_topics:
-        entities_to_include.update(list(entry["topic"].get("related_entities", []) or []))
-
     entities_result = [entity_by_id[entity_id] for entity_id in sorted(entities_to_include) if entity_id in entity_by_id]
 
+    # The response is serialized immediately, so payload lists alias the agenda instead of copying it.
     topics_result: list[dict[str, Any]] = []
     for entry in matched_topics:
-        topic = dict(entry["topic"])
+        topic = entry["topic"]
         topic_payload = {
             "topic_id": topic.get("topic_id", ""),
             "title": topic.get("title", ""),
             "category": topic.get("category", ""),
             "priority": topic.get("priority", ""),
             "why_it_matters": topic.get("why_it_matters", ""),
-            "research_questions": list(topic.get("research_questions", []) or []),
-            "keywords": list(topic.get("keywords", []) or []),
-            "tags": list(topic.get("tags", []) or []),
-            "related_entities": list(topic.get("related_entities", []) or []),
+            "research_questions": topic.get("research_questions", []) or [],
+            "keywords": topic.get("keywords", []) or [],
+            "tags": topic.get("tags", []) or [],
+            "related_entities": topic.get("related_entities", []) or [],
             "block_id": entry["block_id"],
             "block_title": entry["block_title"],
         }
@@ -499,11 +602,7 @@ def main() -> int:
     if args.include_related and entity_filter_id and entity_filter_id in entity_by_id:
         entity_entry = entity_by_id[entity_filter_id]
         owner_block_id = str(entity_entry.get("owner_block_id", "")).strip()
-        owner_block = None
-        for block in blocks:
-            if isinstance(block, dict) and str(block.get("block_id", "")).strip() == owner_block_id:
-                owner_block = block
-                break
+        owner_block = blocks_by_id.get(owner_block_id)
 
         if owner_block is not None:
             related_payload = {
@@ -513,7 +612,7 @@ def main() -> int:
                     "title": owner_block.get("title", ""),
                     "rationale": owner_block.get("rationale", ""),
                 },
-                "owner_block_topics": list(owner_block.get("topics", []) or []),
+                "owner_block_topics": owner_block.get("topics", []) or [],
             }
 
     response = {
@@ -551,7 +650,11 @@ def main() -> int:
     if related_payload:
         response["related"] = related_payload
 
-    print(json.dumps(response, indent=4))
+    if args.pretty:
+        output = json.dumps(response, indent=4)
+    else:
+        output = json.dumps(response, separators=(",", ":"))
+    sys.stdout.write(output + "\n")
     return 0
 
 
@@ -10,14 +10,17 @@ from __future__ import annotations
 
 import argparse
 from difflib import SequenceMatcher
-from fnmatch import fnmatchcase
+from fnmatch import translate
+from functools import lru_cache
+import heapq
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
 IDENTIFIER_KEY_PATTERN = re.compile(
     r"(?:^|[_-])(id|ids|uuid|guid|slug|slugs|identifier|identifiers|key|keys|token|tokens|hash|checksum|fingerprint|ref|refs|code|codes|path|paths|url|urls|uri|uris|file|files|filepath|filepaths)$",
     re.IGNORECASE,
@@ -80,6 +83,11 @@ def parse_args() -> argparse.Namespace:
         default=2,
         help="Skip string values shorter than this length (default: 2)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON response for human reading (default: compact)",
+    )
     return parser.parse_args()
 
 
@@ -87,12 +95,16 @@ def _lower(value: Any) -> str:
     return str(value).strip().lower()
 
 
+@lru_cache(maxsize=4096)
 def _normalize_key(key: str) -> str:
     # Convert camelCase to snake-like form before identifier checks.
-    snakeish = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", str(key))
-    return _lower(snakeish)
+    key_text = str(key)
+    if key_text.islower():
+        return key_text.strip()
+    return _lower(CAMEL_CASE_BOUNDARY_PATTERN.sub(r"\1_\2", key_text))
 
 
+@lru_cache(maxsize=4096)
 def _is_identifier_key(key: str) -> bool:
     normalized = _normalize_key(key)
     return bool(IDENTIFIER_KEY_PATTERN.search(normalized))
@@ -108,46 +120,79 @@ def _normalize_patterns(values: list[str]) -> list[str]:
     return patterns
 
 
-def _path_or_key_matches(patterns: list[str], path: str, key: str) -> bool:
-    path_norm = _lower(path)
-    key_norm = _normalize_key(key)
-    return any(fnmatchcase(path_norm, pattern) or fnmatchcase(key_norm, pattern) for pattern in patterns)
+def _compile_patterns(patterns: list[str]) -> Callable[[str], Any] | None:
+    # Same semantics as fnmatchcase per pattern: literal-only patterns become a set lookup,
+    # anything with wildcards is translated once into a single regex alternation.
+    if not patterns:
+        return None
+    if not any(char in pattern for pattern in patterns for char in "*?["):
+        return frozenset(patterns).__contains__
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in patterns)).match
+
 
+def _path_or_key_matches(matches: Callable[[str], Any], path: str, key: str) -> bool:
+    return bool(matches(_lower(path)) or matches(_normalize_key(key)))
 
-def _tokenize(value: str) -> list[str]:
-    return TOKEN_PATTERN.findall(_lower(value))
 
+@lru_cache(maxsize=4096)
+def _tokenize(value: str) -> tuple[str, ...]:
+    # Array items often repeat the same values; cached tuples are shared, never mutated.
+    return tuple(TOKEN_PATTERN.findall(value.lower()))
 
-def _token_overlap_ratio(query: str, candidate: str) -> float:
-    query_tokens = set(_tokenize(query))
-    candidate_tokens = set(_tokenize(candidate))
-    if not query_tokens or not candidate_tokens:
+
+def _token_overlap_ratio(query_tokens: tuple[str, ...], candidate_tokens: tuple[str, ...]) -> float:
+    query_token_set = set(query_tokens)
+    candidate_token_set = set(candidate_tokens)
+    if not query_token_set or not candidate_token_set:
         return 0.0
-    return len(query_tokens & candidate_tokens) / float(len(query_tokens))
+    return len(query_token_set & candidate_token_set) / float(len(query_token_set))
 
 
-def _fuzzy_score(query: str, candidate: str) -> float:
-    query_norm = _lower(query)
+def _fuzzy_score(
+    query_norm: str,
+    query_tokens: tuple[str, ...],
+    candidate: str,
+    *,
+    threshold: float = 0.0,
+) -> float:
     candidate_norm = _lower(candidate)
     if not query_norm or not candidate_norm:
         return 0.0
     if query_norm in candidate_norm:
         return 1.0
 
-    best = max(
-        SequenceMatcher(None, query_norm, candidate_norm).ratio(),
-        _token_overlap_ratio(query_norm, candidate_norm),
-    )
-
     candidate_tokens = _tokenize(candidate_norm)
-    query_token_count = max(1, len(_tokenize(query_norm)))
+    best = _token_overlap_ratio(query_tokens, candidate_tokens)
+    # ratio() can never exceed 2*min(len)/(sum of lens), and no phrase is longer than the
+    # candidate, so a short candidate that cannot reach the threshold is rejected unscored.
+    query_length = len(query_norm)
+    candidate_length = len(candidate_norm)
+    if candidate_length < query_length and best < threshold:
+        if 2.0 * candidate_length / (query_length + candidate_length) < threshold:
+            return best
+
+    # One matcher per candidate: the query stays as seq1 and each phrase only swaps seq2.
+    # Phrases whose upper bounds cannot beat the current best (or the threshold) are skipped.
+    matcher = SequenceMatcher(None, query_norm, candidate_norm)
+    query_token_count = max(1, len(query_tokens))
     max_span = min(len(candidate_tokens), max(query_token_count + 1, 3))
+    phrases = [candidate_norm]
     for span in range(1, max_span + 1):
         for start in range(0, len(candidate_tokens) - span + 1):
-            phrase = " ".join(candidate_tokens[start : start + span])
-            score = SequenceMatcher(None, query_norm, phrase).ratio()
-            if score > best:
-                best = score
+            phrases.append(" ".join(candidate_tokens[start : start + span]))
+
+    seen_phrases: set[str] = set()
+    for phrase in phrases:
+        if phrase in seen_phrases:
+            continue
+        seen_phrases.add(phrase)
+        matcher.set_seq2(phrase)
+        floor = best if best > threshold else threshold
+        if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+            continue
+        score = matcher.ratio()
+        if score > best:
+            best = score
     return best
 
 
@@ -158,33 +203,60 @@ def _preview(value: str, limit: int = 220) -> str:
     return text[: limit - 3] + "..."
 
 
-def _iter_scalar_candidates(node: Any, *, path: str = "", key: str = ""):
-    if isinstance(node, dict):
-        for child_key, child_value in node.items():
-            child_key_text = str(child_key)
-            child_path = f"{path}.{child_key_text}" if path else child_key_text
-            yield from _iter_scalar_candidates(child_value, path=child_path, key=child_key_text)
-        return
-
-    if isinstance(node, list):
-        for index, item in enumerate(node):
-            child_path = f"{path}[{index}]"
-            yield from _iter_scalar_candidates(item, path=child_path, key=key)
-        return
-
-    yield {
-        "path": path,
-        "key": key,
-        "value": node,
-    }
+def _path_prefixes(patterns: list[str]) -> tuple[str, ...]:
+    # Literal text before the first wildcard of each pattern. Pruning is only enabled when every
+    # pattern is a dotted path pattern; a bare pattern such as "title" can match a key anywhere.
+    prefixes = []
+    for pattern in patterns:
+        prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        if "." not in prefix:
+            return ()
+        prefixes.append(prefix)
+    return tuple(prefixes)
+
+
+def _may_contain_match(path: str, prefixes: tuple[str, ...]) -> bool:
+    # Leading whitespace is ignored because matching uses _lower() on the full path.
+    path_norm = path.lstrip().lower()
+    return any(prefix.startswith(path_norm) or path_norm.startswith(prefix) for prefix in prefixes)
+
+
+def _iter_scalar_candidates(node: Any, prefixes: tuple[str, ...] = ()):
+    # Explicit stack instead of recursive generators; children are pushed in reverse so
+    # scalars still come out in document order as (path, key, value, reachable) tuples.
+    # With prefixes, reachable is False below any node whose path cannot lead to a --field
+    # pattern. Such subtrees are still walked: a key that itself contains "." can match a
+    # dotted pattern as a bare key, and every scalar counts towards candidates_scanned.
+    stack: list[tuple[Any, str, str, bool]] = [(node, "", "", True)]
+    while stack:
+        node, path, key, reachable = stack.pop()
+        if isinstance(node, dict):
+            children = []
+            for child_key, child_value in node.items():
+                child_key_text = str(child_key)
+                child_path = f"{path}.{child_key_text}" if path else child_key_text
+                child_reachable = reachable and (not prefixes or _may_contain_match(child_path, prefixes))
+                children.append((child_value, child_path, child_key_text, child_reachable))
+            children.reverse()
+            stack.extend(children)
+        elif isinstance(node, list):
+            children = []
+            for index, item in enumerate(node):
+                child_path = f"{path}[{index}]"
+                child_reachable = reachable and (not prefixes or _may_contain_match(child_path, prefixes))
+                children.append((item, child_path, key, child_reachable))
+            children.reverse()
+            stack.extend(children)
+        else:
+            yield path, key, node, reachable
 
 
 def _load_json(path: Path) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except OSError as exc:
         raise ValueError(f"PAYLOAD_READ_FAILED: {exc}") from exc
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"INVALID_PAYLOAD_JSON: {exc}") from exc
 
 
@@ -204,6 +276,9 @@ def main() -> int:
 
     include_patterns = _normalize_patterns(args.field)
     exclude_patterns = _normalize_patterns(args.exclude_field)
+    include_matcher = _compile_patterns(include_patterns)
+    exclude_matcher = _compile_patterns(exclude_patterns)
+    include_prefixes = _path_prefixes(include_patterns)
 
     try:
         payload = _load_json(payload_path)
@@ -211,55 +286,64 @@ def main() -> int:
         print(str(exc), file=sys.stderr)
         return 2
 
-    candidates_scanned = 0
-    candidates_considered = 0
-    matches: list[dict[str, Any]] = []
-
-    for candidate in _iter_scalar_candidates(payload):
-        candidates_scanned += 1
-        field_path = str(candidate["path"])
-        field_key = str(candidate["key"])
-
-        if not args.include_identifiers and _is_identifier_key(field_key):
-            continue
-        if include_patterns and not _path_or_key_matches(include_patterns, field_path, field_key):
-            continue
-        if exclude_patterns and _path_or_key_matches(exclude_patterns, field_path, field_key):
-            continue
-
-        raw_value = candidate["value"]
-        if isinstance(raw_value, str):
-            text_value = raw_value.strip()
-            value_type = "string"
-        elif args.include_non_string and isinstance(raw_value, (int, float, bool)):
-            text_value = str(raw_value)
-            value_type = type(raw_value).__name__
-        else:
-            continue
-
-        if len(text_value) < args.min_length:
-            continue
-
-        candidates_considered += 1
-        score = _fuzzy_score(args.text, text_value)
-        if score < args.threshold:
-            continue
-
-        matches.append(
-            {
-                "path": field_path,
-                "field": field_key,
-                "value_type": value_type,
-                "score": round(score, 4),
-                "value_preview": _preview(text_value),
-            }
+    query_norm = _lower(args.text)
+    query_tokens = _tokenize(query_norm)
+    # Repeated scalars (enums, tags, category names) are scored once per distinct value.
+    score_cache: dict[str, float] = {}
+    counts = {"scanned": 0, "considered": 0, "matched": 0}
+
+    def iter_matches():
+        for sequence, (field_path, field_key, raw_value, reachable) in enumerate(
+            _iter_scalar_candidates(payload, include_prefixes)
+        ):
+            counts["scanned"] += 1
+            # Off every --field path, only a key containing "." can still match (as a bare key).
+            if not reachable and "." not in field_key:
+                continue
+            if not args.include_identifiers and _is_identifier_key(field_key):
+                continue
+            if include_matcher is not None and not _path_or_key_matches(include_matcher, field_path, field_key):
+                continue
+            if exclude_matcher is not None and _path_or_key_matches(exclude_matcher, field_path, field_key):
+                continue
+
+            if isinstance(raw_value, str):
+                text_value = raw_value.strip()
+                value_type = "string"
+            elif args.include_non_string and isinstance(raw_value, (int, float, bool)):
+                text_value = str(raw_value)
+                value_type = type(raw_value).__name__
+            else:
+                continue
+
+            if len(text_value) < args.min_length:
+                continue
+
+            counts["considered"] += 1
+            score = score_cache.get(text_value)
+            if score is None:
+                score = _fuzzy_score(query_norm, query_tokens, text_value, threshold=args.threshold)
+                score_cache[text_value] = score
+            if score < args.threshold:
+                continue
+
+            counts["matched"] += 1
+            # The scan sequence keeps ties in document order, as the previous stable sort did.
+            yield (-round(score, 4), field_path, sequence, field_key, value_type, text_value)
+
+    # Only the best --limit matches are retained while scanning.
+    results = [
+        {
+            "path": field_path,
+            "field": field_key,
+            "value_type": value_type,
+            "score": -negative_score,
+            "value_preview": _preview(text_value),
+        }
+        for negative_score, field_path, _, field_key, value_type, text_value in heapq.nsmallest(
+            args.limit, iter_matches()
         )
-
-    matches_sorted = sorted(
-        matches,
-        key=lambda item: (-item["score"], item["path"]),
-    )
-    results = matches_sorted[: args.limit]
+    ]
 
     response: dict[str, Any] = {
         "status": "ok",
@@ -275,9 +359,9 @@ def main() -> int:
             "min_length": args.min_length,
         },
         "summary": {
-            "candidates_scanned": candidates_scanned,
-            "candidates_considered": candidates_considered,
-            "matches_before_limit": len(matches_sorted),
+            "candidates_scanned": counts["scanned"],
+            "candidates_considered": counts["considered"],
+            "matches_before_limit": counts["matched"],
             "matches_returned": len(results),
         },
         "results": results,
@@ -286,7 +370,11 @@ def main() -> int:
     if results:
         response["summary"]["best_score"] = max(item["score"] for item in results)
 
-    print(json.dumps(response, indent=4))
+    if args.pretty:
+        output = json.dumps(response, indent=4)
+    else:
+        output = json.dumps(response, separators=(",", ":"))
+    sys.stdout.write(output + "\n")
     return 0
 
 
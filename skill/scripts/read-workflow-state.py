@@ -2,7 +2,6 @@
 """Read and normalize Cadence workflow state from .cadence/cadence.json."""
 
 import argparse
-import copy
 import json
 import sys
 from pathlib import Path
@@ -34,36 +33,36 @@ def cadence_paths(project_root: Path) -> tuple[Path, Path]:
 
 def load_state(project_root: Path):
     cadence_dir, cadence_json_path = cadence_paths(project_root)
-    cadence_exists = cadence_dir.exists()
 
-    if not cadence_json_path.exists():
+    try:
+        raw_state = cadence_json_path.read_bytes()
+    except FileNotFoundError:
         data = default_data()
         # When `.cadence` exists without cadence.json, initialize recovery state
         # with scaffold pending so route guards can re-enter scaffold safely.
         data = reconcile_workflow_state(data, cadence_dir_exists=False)
-        if cadence_exists:
+        if cadence_dir.exists():
             save_state(project_root, data)
         return data
 
     try:
-        with cadence_json_path.open("r", encoding="utf-8") as file:
-            original_data = json.load(file)
-    except json.JSONDecodeError as exc:
+        original_data = json.loads(raw_state)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         print(f"INVALID_CADENCE_JSON: {exc}", file=sys.stderr)
         raise SystemExit(1)
 
-    data = reconcile_workflow_state(copy.deepcopy(original_data), cadence_dir_exists=cadence_exists)
-    if data != original_data:
+    # Reconcile mutates in place; a canonical dump taken beforehand replaces a deep copy + deep compare.
+    original_snapshot = json.dumps(original_data, sort_keys=True)
+    data = reconcile_workflow_state(original_data, cadence_dir_exists=True)
+    if json.dumps(data, sort_keys=True) != original_snapshot:
         save_state(project_root, data)
     return data
 
 
 def save_state(project_root: Path, data):
-    cadence_dir, cadence_json_path = cadence_paths(project_root)
-    cadence_dir.mkdir(parents=True, exist_ok=True)
-    with cadence_json_path.open("w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4)
-        file.write("\n")
+    # Only called once `.cadence` is known to exist, so no mkdir is needed.
+    _, cadence_json_path = cadence_paths(project_root)
+    cadence_json_path.write_text(json.dumps(data, indent=4) + "\n", encoding="utf-8")
 
 
 def build_response(data, project_root: Path, project_root_source: str):
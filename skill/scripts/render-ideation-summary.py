@@ -4,14 +4,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from ideation_state import load_ideation
 from project_root import resolve_project_root, write_project_root_hint
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+CONTAINER_TYPES = frozenset((dict, list))
+NO_SKIP_KEYS = frozenset()
+AGENDA_KEYS = frozenset(("research_agenda",))
 
 
 def parse_args() -> argparse.Namespace:
@@ -26,63 +30,78 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def cadence_json_path(project_root: Path) -> Path:
-    return project_root / ".cadence" / "cadence.json"
-
-
+@lru_cache(maxsize=1024)
 def humanize_key(key):
     return str(key).replace("_", " ").replace("-", " ").strip().title()
 
 
 def scalar_to_text(value):
-    if isinstance(value, bool):
-        return "Yes" if value else "No"
+    # Most JSON leaves are already strings; return those without another str() call.
+    if type(value) is str:
+        return value
+    if value is True:
+        return "Yes"
+    if value is False:
+        return "No"
     if value is None:
         return "None"
     return str(value)
 
 
-def render_value(value, indent=0):
-    space = " " * indent
+def render_value(value, indent=0, skip_keys=NO_SKIP_KEYS):
+    # Explicit stack of pending work: finished lines (str) or (value, indent) still to expand.
+    # Children are pushed in reverse so lines come out in document order. Values come from
+    # json.loads, so exact type() checks stand in for isinstance on this per-node path.
+    # skip_keys only applies to the top-level dict. Lines before a container's first nested
+    # child are appended straight to the output; only the rest is deferred through the stack.
     lines = []
+    stack = [(value, indent, skip_keys)]
+    while stack:
+        entry = stack.pop()
+        if type(entry) is str:
+            lines.append(entry)
+            continue
 
-    if isinstance(value, dict):
-        if not value:
-            return [f"{space}(empty)"]
-        for key, inner in value.items():
-            label = humanize_key(key)
-            if isinstance(inner, (dict, list)):
-                lines.append(f"{space}- {label}:")
-                lines.extend(render_value(inner, indent + 2))
-            else:
-                lines.append(f"{space}- {label}: {scalar_to_text(inner)}")
-        return lines
-
-    if isinstance(value, list):
-        if not value:
-            return [f"{space}(empty list)"]
-        for idx, item in enumerate(value, start=1):
-            if isinstance(item, (dict, list)):
-                lines.append(f"{space}- Item {idx}:")
-                lines.extend(render_value(item, indent + 2))
-            else:
-                lines.append(f"{space}- {scalar_to_text(item)}")
-        return lines
+        value, indent, skip_keys = entry
+        space = " " * indent
+        pending = []
+        value_type = type(value)
 
-    return [f"{space}{scalar_to_text(value)}"]
+        if value_type is dict:
+            if not value:
+                lines.append(f"{space}(empty)")
+                continue
+            out = lines
+            for key, inner in value.items():
+                if key in skip_keys:
+                    continue
+                label = humanize_key(key)
+                if type(inner) in CONTAINER_TYPES:
+                    out.append(f"{space}- {label}:")
+                    pending.append((inner, indent + 2, NO_SKIP_KEYS))
+                    out = pending
+                else:
+                    out.append(f"{space}- {label}: {scalar_to_text(inner)}")
+        elif value_type is list:
+            if not value:
+                lines.append(f"{space}(empty list)")
+                continue
+            out = lines
+            for idx, item in enumerate(value, start=1):
+                if type(item) in CONTAINER_TYPES:
+                    out.append(f"{space}- Item {idx}:")
+                    pending.append((item, indent + 2, NO_SKIP_KEYS))
+                    out = pending
+                else:
+                    out.append(f"{space}- {scalar_to_text(item)}")
+        else:
+            lines.append(f"{space}{scalar_to_text(value)}")
+            continue
 
+        pending.reverse()
+        stack.extend(pending)
 
-def load_ideation(project_root: Path):
-    state_path = cadence_json_path(project_root)
-    if not state_path.exists():
-        return {}
-    try:
-        with state_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"INVALID_CADENCE_JSON: {exc} path={state_path}") from exc
-    ideation = data.get("ideation", {})
-    return ideation if isinstance(ideation, dict) else {}
+    return lines
 
 
 def render_research_agenda(agenda):
@@ -92,13 +111,17 @@ def render_research_agenda(agenda):
     blocks = agenda.get("blocks") if isinstance(agenda.get("blocks"), list) else []
     entities = agenda.get("entity_registry") if isinstance(agenda.get("entity_registry"), list) else []
     summary = agenda.get("summary") if isinstance(agenda.get("summary"), dict) else {}
+    # Each block's topics list is looked up once and shared by the count and the detail pass.
+    block_topics = []
+    for block in blocks:
+        if not isinstance(block, dict):
+            continue
+        topics = block.get("topics")
+        block_topics.append((block, topics if isinstance(topics, list) else []))
+
     topic_count = int(summary.get("topic_count", 0))
     if not topic_count:
-        topic_count = sum(
-            len(block.get("topics", []))
-            for block in blocks
-            if isinstance(block, dict) and isinstance(block.get("topics"), list)
-        )
+        topic_count = sum(len(topics) for _, topics in block_topics)
 
     lines = ["Research Agenda", "---------------"]
     lines.append(f"- Blocks: {len(blocks)}")
@@ -110,12 +133,9 @@ def render_research_agenda(agenda):
         return lines
 
     lines.append("- Blocks Detail:")
-    for block in blocks:
-        if not isinstance(block, dict):
-            continue
+    for block, topics in block_topics:
         block_title = scalar_to_text(block.get("title", "Untitled"))
         block_id = scalar_to_text(block.get("block_id", ""))
-        topics = block.get("topics") if isinstance(block.get("topics"), list) else []
         lines.append(f"  - {block_title} ({block_id})")
         for topic in topics:
             if not isinstance(topic, dict):
@@ -149,22 +169,20 @@ def main():
         print(str(exc), file=sys.stderr)
         return 1
 
-    print("Current Project Ideation")
-    print("========================")
+    # Lines are collected and written once instead of one print() call per line.
+    lines = ["Current Project Ideation", "========================"]
     if not ideation:
-        print("No ideation is currently saved.")
+        lines.append("No ideation is currently saved.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
-    core_ideation = {key: value for key, value in ideation.items() if key != "research_agenda"}
-    if core_ideation:
-        for line in render_value(core_ideation):
-            print(line)
+    # Core fields are rendered straight from the ideation dict instead of a filtered copy.
+    if any(key not in AGENDA_KEYS for key in ideation):
+        lines.extend(render_value(ideation, skip_keys=AGENDA_KEYS))
+        lines.append("")
 
-    agenda_lines = render_research_agenda(ideation.get("research_agenda"))
-    if core_ideation:
-        print()
-    for line in agenda_lines:
-        print(line)
+    lines.extend(render_research_agenda(ideation.get("research_agenda")))
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
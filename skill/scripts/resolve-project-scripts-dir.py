@@ -4,14 +4,17 @@
 Behavior:
 - If state.cadence-scripts-dir exists in .cadence/cadence.json and points to
   an existing directory, use it.
-- If missing or stale but .cadence exists, regenerate project path state by
-  running init-cadence-scripts-dir.py from this skill's scripts directory.
+- If missing or stale but .cadence exists, regenerate project path state with
+  init-cadence-scripts-dir.py from this skill's scripts directory, loaded
+  in-process instead of spawning another interpreter, and use the value it
+  persisted.
 - Print the resolved scripts directory to stdout.
+- Remember the result next to this script, keyed by the project root and the
+  cadence.json mtime/size, so unchanged state skips the JSON parse next time.
 """
 
 import argparse
-import json
-import subprocess
+import os
 import sys
 from pathlib import Path
 
@@ -20,10 +23,7 @@ from project_root import resolve_project_root, write_project_root_hint
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 INIT_SCRIPT_PATH = SCRIPT_DIR / "init-cadence-scripts-dir.py"
-
-
-def run_command(command):
-    return subprocess.run(command, capture_output=True, text=True, check=False)
+SCRIPTS_DIR_CACHE_PATH = SCRIPT_DIR / ".last-scripts-dir"
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,57 +38,101 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def initialize_scripts_dir(project_root: Path):
-    result = run_command(
-        [
-            sys.executable,
-            str(INIT_SCRIPT_PATH),
-            "--project-root",
-            str(project_root),
-        ]
-    )
-    if result.returncode != 0:
-        stderr = result.stderr.strip() or "FAILED_TO_INIT_CADENCE_SCRIPTS_DIR"
-        print(stderr, file=sys.stderr)
-        raise SystemExit(result.returncode)
+def load_init_module():
+    # Only the self-heal path needs importlib; keep it off the warm-cache path.
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("init_cadence_scripts_dir", INIT_SCRIPT_PATH)
+    if spec is None or spec.loader is None:
+        print("FAILED_TO_INIT_CADENCE_SCRIPTS_DIR", file=sys.stderr)
+        raise SystemExit(1)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def initialize_scripts_dir(project_root: Path) -> str:
+    try:
+        return str(load_init_module().persist_scripts_dir(project_root)).strip()
+    except (OSError, ValueError) as exc:
+        print(str(exc) or "FAILED_TO_INIT_CADENCE_SCRIPTS_DIR", file=sys.stderr)
+        raise SystemExit(1)
 
 
 def read_scripts_dir_from_cadence_json(project_root: Path):
-    cadence_json_path = project_root / ".cadence" / "cadence.json"
-    if not cadence_json_path.exists():
-        return ""
+    # Deferred so a scripts-dir cache hit never imports json.
+    import json
 
+    cadence_json_path = project_root / ".cadence" / "cadence.json"
     try:
-        with cadence_json_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except json.JSONDecodeError as exc:
+        data = json.loads(cadence_json_path.read_bytes())
+    except FileNotFoundError:
+        return ""
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         print(f"INVALID_CADENCE_JSON: {exc}", file=sys.stderr)
         raise SystemExit(1)
 
     return str(data.get("state", {}).get("cadence-scripts-dir", "")).strip()
 
 
+def scripts_dir_cache_key(project_root: Path) -> str:
+    try:
+        stat = os.stat(project_root / ".cadence" / "cadence.json")
+    except OSError:
+        return ""
+    return f"{project_root}\n{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def read_cached_scripts_dir(cache_key: str) -> str:
+    if not cache_key:
+        return ""
+    try:
+        raw = SCRIPTS_DIR_CACHE_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+    cached_key, _, scripts_dir = raw.rstrip("\n").rpartition("\n")
+    if cached_key == cache_key and scripts_dir and os.path.isdir(scripts_dir):
+        return scripts_dir
+    return ""
+
+
+def write_cached_scripts_dir(cache_key: str, scripts_dir: str) -> None:
+    if not cache_key:
+        return
+    try:
+        SCRIPTS_DIR_CACHE_PATH.write_text(f"{cache_key}\n{scripts_dir}\n", encoding="utf-8")
+    except OSError:
+        # The cache is convenience only; resolution already succeeded.
+        return
+
+
 def ensure_scripts_dir(project_root: Path):
     cadence_dir = project_root / ".cadence"
     if not cadence_dir.exists():
         print("MISSING_CADENCE_DIR", file=sys.stderr)
         raise SystemExit(1)
 
-    scripts_dir = read_scripts_dir_from_cadence_json(project_root)
-    if scripts_dir and Path(scripts_dir).is_dir():
+    cache_key = scripts_dir_cache_key(project_root)
+    scripts_dir = read_cached_scripts_dir(cache_key)
+    if scripts_dir:
         return scripts_dir
 
-    initialize_scripts_dir(project_root)
-
     scripts_dir = read_scripts_dir_from_cadence_json(project_root)
+    if scripts_dir and os.path.isdir(scripts_dir):
+        write_cached_scripts_dir(cache_key, scripts_dir)
+        return scripts_dir
+
+    # The init helper returns the value it persisted, so cadence.json is not re-read.
+    scripts_dir = initialize_scripts_dir(project_root)
     if not scripts_dir:
         print("MISSING_CADENCE_SCRIPTS_DIR", file=sys.stderr)
         raise SystemExit(1)
 
-    if not Path(scripts_dir).is_dir():
+    if not os.path.isdir(scripts_dir):
         print("INVALID_CADENCE_SCRIPTS_DIR", file=sys.stderr)
         raise SystemExit(1)
 
+    write_cached_scripts_dir(scripts_dir_cache_key(project_root), scripts_dir)
     return scripts_dir
 
 
@@ -9,6 +9,11 @@ This script intentionally separates:
 from __future__ import annotations
 
 import argparse
+import codecs
+import hashlib
+import heapq
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
 import os
@@ -16,18 +21,21 @@ import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from atomic_write import write_bytes_atomic
+from brownfield_scan import SKIP_FILENAMES
 from ideation_research import normalize_ideation_research, reset_research_execution
 from project_root import resolve_project_root, write_project_root_hint
-from workflow_state import default_data, reconcile_workflow_state, set_workflow_item_status
+from workflow_state import default_data, reconcile_workflow_state, set_workflow_items
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROUTE_GUARD_SCRIPT = SCRIPT_DIR / "assert-workflow-route.py"
 CADENCE_JSON_REL = Path(".cadence") / "cadence.json"
+DISCOVERY_CACHE_REL = Path(".cadence") / "brownfield-discovery-cache.json"
 
-DEFAULT_EXCLUDED_DIRS = {
+DEFAULT_EXCLUDED_DIRS = frozenset({
     ".cadence",
     ".git",
     ".hg",
@@ -43,9 +51,9 @@ DEFAULT_EXCLUDED_DIRS = {
     "dist",
     "build",
     "coverage",
-}
+})
 
-KNOWN_MANIFESTS = {
+KNOWN_MANIFESTS = frozenset({
     "package.json",
     "pnpm-workspace.yaml",
     "yarn.lock",
@@ -69,7 +77,21 @@ KNOWN_MANIFESTS = {
     "docker-compose.yml",
     "docker-compose.yaml",
     "Dockerfile",
-}
+})
+
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+READ_WORKERS = 8
+
+DOC_EXTENSIONS = (".md", ".mdx", ".txt", ".rst", ".adoc")
+DOC_NAMES = frozenset({"about.md", "architecture.md", "changelog.md"})
+BINARY_SNIFF_BYTES = 512
+ENTITY_FIELDS = ("entity_id", "label", "kind", "aliases", "owner_block_id")
+GITIGNORE_NAME = ".gitignore"
+GLOB_CHARS = frozenset("*?[")
+
+_WS_RE = re.compile(r"\s+")
+_SENTENCE_RE = re.compile(r"(.+?[.!?])(\s|$)")
+_SLUG_TABLE = bytes(byte if 48 <= byte <= 57 or 97 <= byte <= 122 else 45 for byte in range(256))
 
 
 def parse_args() -> argparse.Namespace:
@@ -106,6 +128,29 @@ def parse_args() -> argparse.Namespace:
         default=40,
         help="Maximum package manifests to parse for signals.",
     )
+    discover.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help=(
+            "Directory name or glob (gitignore-style, relative to the project root) to skip while "
+            "scanning. Repeatable."
+        ),
+    )
+    discover.add_argument(
+        "--gitignore",
+        action="store_true",
+        help="Also prune directories ignored by the project root .gitignore (off by default).",
+    )
+    discover.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse discovery context from .cadence/brownfield-discovery-cache.json while the mtimes of all "
+            "scanned directories and of the files read into the context are unchanged, and write it after a "
+            "fresh scan. A cache hit returns the stored context, so captured_at is the original scan time."
+        ),
+    )
 
     complete = subparsers.add_parser(
         "complete",
@@ -157,12 +202,14 @@ def cadence_json_path(project_root: Path) -> Path:
 
 def load_state(project_root: Path) -> dict[str, Any]:
     state_path = cadence_json_path(project_root)
-    if not state_path.exists():
+    try:
+        raw = state_path.read_bytes()
+    except FileNotFoundError:
         return default_data()
 
     try:
-        payload = json.loads(state_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        payload = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         print(f"INVALID_CADENCE_JSON: {exc} path={state_path}", file=sys.stderr)
         raise SystemExit(1)
     if not isinstance(payload, dict):
@@ -173,69 +220,296 @@ def load_state(project_root: Path) -> dict[str, Any]:
 def save_state(project_root: Path, data: dict[str, Any]) -> None:
     path = cadence_json_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=4) + "\n", encoding="utf-8")
-
-
-def safe_read_text(path: Path, max_chars: int = 2000) -> str:
+    write_bytes_atomic(path, json.dumps(data, indent=4).encode("utf-8") + b"\n")
+
+
+def safe_read_text(path: Path, max_chars: int = 2000) -> str | None:
+    # Returns None for binary content: a NUL within the first BINARY_SNIFF_BYTES.
+    # Read in bounded chunks (UTF-8 needs at most 4 bytes per char), decoding and collapsing
+    # only each new chunk, and stop once the collapsed text is longer than max_chars. A run of
+    # whitespace split across chunks is joined back into one space, so the slice matches a
+    # full read. Whitespace-heavy or mostly undecodable files stop at a hard byte cap instead.
+    chunk_size = max(max_chars * 4, BINARY_SNIFF_BYTES)
+    remaining = max(max_chars * 16, BINARY_SNIFF_BYTES)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    parts: list[str] = []
+    length = 0
+    trailing_space = False
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        with open(path, "rb") as handle:
+            chunk = handle.read(min(chunk_size, remaining))
+            if b"\x00" in chunk[:BINARY_SNIFF_BYTES]:
+                return None
+            while True:
+                remaining -= len(chunk)
+                piece = _WS_RE.sub(" ", decoder.decode(chunk, final=not chunk))
+                if piece[:1] == " " and (trailing_space or not parts):
+                    piece = piece[1:]
+                if piece:
+                    parts.append(piece)
+                    length += len(piece)
+                    trailing_space = piece[-1] == " "
+                if not chunk or remaining <= 0 or length - trailing_space > max_chars:
+                    break
+                chunk = handle.read(min(chunk_size, remaining))
     except OSError:
         return ""
-    text = re.sub(r"\s+", " ", text).strip()
-    return text[:max_chars]
+    return "".join(parts).rstrip()[:max_chars]
 
 
 def first_sentence(text: str) -> str:
     candidate = str(text).strip()
     if not candidate:
         return ""
-    match = re.search(r"(.+?[.!?])(\s|$)", candidate)
+    match = _SENTENCE_RE.search(candidate)
     if match:
         return match.group(1).strip()
     return candidate[:240]
 
 
+def _glob_to_regex(pattern: str) -> str:
+    # gitignore-style globs: "*" and "?" stay within one path segment, "**" spans segments
+    # and a backslash makes the next character literal.
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+            continue
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and "]" in pattern[index + 2 :]:
+            end = pattern.index("]", index + 2)
+            body = pattern[index + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def _gitignore_rule(line: str) -> tuple[str, bool] | None:
+    # One .gitignore line as (path regex, negated), or None for blanks and comments.
+    # Trailing spaces are dropped unless escaped; "\#" and "\!" start literal patterns.
+    if line.startswith("#"):
+        return None
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    # Only directories are matched, so the directory-only "/" suffix needs no special case.
+    if line.endswith("/") and not line.endswith("\\/"):
+        line = line[:-1]
+    anchored = "/" in line
+    line = line[1:] if line.startswith("/") else line
+    if not line:
+        return None
+    body = _glob_to_regex(line)
+    return (body if anchored else f"(?:.*/)?{body}"), negated
+
+
+def load_gitignore_rules(project_root: Path) -> list[tuple[str, bool]]:
+    try:
+        lines = (project_root / GITIGNORE_NAME).read_bytes().decode("utf-8", errors="ignore").splitlines()
+    except OSError:
+        return []
+    rules: list[tuple[str, bool]] = []
+    for line in lines:
+        rule = _gitignore_rule(line)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+def compile_dir_excludes(
+    patterns: list[str],
+    gitignore_rules: list[tuple[str, bool]] | None = None,
+) -> tuple[frozenset[str], Callable[[str], Any] | None]:
+    # Plain names join DEFAULT_EXCLUDED_DIRS for O(1) lookups; globs and anchored paths are
+    # folded into one regex matched against each directory's project-relative path.
+    names = set(DEFAULT_EXCLUDED_DIRS)
+    regexes: list[str] = []
+    for raw_pattern in patterns:
+        pattern = raw_pattern.strip().rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            continue
+        if not anchored and GLOB_CHARS.isdisjoint(pattern):
+            names.add(pattern)
+            continue
+        body = _glob_to_regex(pattern)
+        regexes.append(body if anchored else f"(?:.*/)?{body}")
+
+    rules = gitignore_rules or []
+    if not any(negated for _, negated in rules):
+        regexes.extend(regex for regex, _ in rules)
+        rules = []
+    excluded = re.compile("|".join(f"(?:{regex})" for regex in regexes)).fullmatch if regexes else None
+    if not rules:
+        return frozenset(names), excluded
+
+    # With "!" rules the last matching .gitignore line decides, as in git. A re-included path
+    # inside a pruned directory stays pruned, which git does too: it never descends there.
+    ordered_rules = [(re.compile(regex).fullmatch, negated) for regex, negated in reversed(rules)]
+
+    def excluded_path(rel_path: str) -> bool:
+        if excluded is not None and excluded(rel_path):
+            return True
+        for match, negated in ordered_rules:
+            if match(rel_path):
+                return not negated
+        return False
+
+    return frozenset(names), excluded_path
+
+
+def list_directory(
+    dir_path: str,
+    record_mtime: bool = False,
+) -> tuple[int | None, list[tuple[str, str, bool | None]]] | None:
+    # (name, path, walkable): walkable is None for files, False for symlinked directories
+    # (which os.walk neither lists as files nor follows) and True for real directories.
+    # The directory mtime is taken before listing, so a change made during the scan shows up
+    # as a newer mtime on the next lookup.
+    mtime = None
+    try:
+        if record_mtime:
+            mtime = os.stat(dir_path).st_mtime_ns
+        with os.scandir(dir_path) as iterator:
+            entries = list(iterator)
+    except OSError:
+        return None
+
+    listing: list[tuple[str, str, bool | None]] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        listing.append((entry.name, entry.path, not entry.is_symlink() if is_dir else None))
+    return mtime, listing
+
+
 def iter_repo_files(
     project_root: Path,
     *,
     max_scan_files: int,
-) -> tuple[list[str], dict[str, int], dict[str, int], bool]:
+    excluded_names: frozenset[str] = DEFAULT_EXCLUDED_DIRS,
+    excluded_path: Callable[[str], Any] | None = None,
+    dir_mtimes: dict[str, int | None] | None = None,
+) -> tuple[list[str], dict[str, int], dict[str, int], bool, dict[str, list[str]]]:
     files: list[str] = []
-    ext_counts: dict[str, int] = {}
-    top_dir_counts: dict[str, int] = {}
+    ext_counts: Counter[str] = Counter()
+    top_dir_counts: Counter[str] = Counter()
+    signals: dict[str, list[str]] = {
+        "manifests": [],
+        "package_json_paths": [],
+        "ci_workflows": [],
+        "docker_files": [],
+        "doc_candidates": [],
+    }
+    manifests = signals["manifests"]
+    package_json_paths = signals["package_json_paths"]
+    ci_workflows = signals["ci_workflows"]
+    docker_files = signals["docker_files"]
+    doc_candidates = signals["doc_candidates"]
     scanned = 0
     truncated = False
 
-    for root, dirs, filenames in os.walk(project_root):
-        dirs[:] = [name for name in dirs if name not in DEFAULT_EXCLUDED_DIRS]
-        rel_root = Path(root).resolve().relative_to(project_root)
-
-        for filename in filenames:
-            if scanned >= max_scan_files:
-                truncated = True
-                return files, ext_counts, top_dir_counts, truncated
-            if filename.startswith(".DS_Store"):
+    # Explicit stack in os.walk order: a directory's files first, then its subdirectories
+    # depth-first in listing order. Each directory is listed on a worker thread as soon as
+    # its parent has been consumed, so scandir latency overlaps while counts, signals and
+    # truncation stay single-threaded and deterministic. Relative paths are tracked as
+    # strings so no Path objects are built per directory or per file. Manifest, CI, Docker
+    # and doc signals are classified here so callers never re-scan the file list. When
+    # dir_mtimes is given, it receives the mtime of every directory listed.
+    record_mtime = dir_mtimes is not None
+    pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+    try:
+        stack: list[tuple[Future[tuple[int | None, list[tuple[str, str, bool | None]]] | None], str, str]] = [
+            (pool.submit(list_directory, str(project_root), record_mtime), "", "(root)")
+        ]
+        while stack:
+            future, rel_dir, top_dir = stack.pop()
+            listed = future.result()
+            if listed is None:
                 continue
+            mtime, entries = listed
+            if dir_mtimes is not None:
+                dir_mtimes[rel_dir] = mtime
+
+            in_workflows = rel_dir == ".github/workflows" or rel_dir.startswith(".github/workflows/")
+            rel_dir_lower = rel_dir.lower()
+            in_docs = rel_dir_lower == "docs" or rel_dir_lower.startswith("docs/")
+            subdirs: list[tuple[Future[tuple[int | None, list[tuple[str, str, bool | None]]] | None], str, str]] = []
+            for name, path, walkable in entries:
+                if walkable is not None:
+                    if walkable and name not in excluded_names:
+                        child_rel = f"{rel_dir}/{name}" if rel_dir else name
+                        if excluded_path is not None and excluded_path(child_rel):
+                            continue
+                        child_top = top_dir if rel_dir else name
+                        subdirs.append((pool.submit(list_directory, path, record_mtime), child_rel, child_top))
+                    continue
 
-            rel_path = (rel_root / filename).as_posix() if str(rel_root) != "." else filename
-            files.append(rel_path)
-            scanned += 1
-
-            ext = Path(rel_path).suffix.lower() or "(no-ext)"
-            ext_counts[ext] = ext_counts.get(ext, 0) + 1
+                if scanned >= max_scan_files:
+                    truncated = True
+                    return files, ext_counts, top_dir_counts, truncated, signals
+                if name in SKIP_FILENAMES or name.startswith(".DS_Store"):
+                    continue
 
-            parts = Path(rel_path).parts
-            top_dir = parts[0] if len(parts) > 1 else "(root)"
-            top_dir_counts[top_dir] = top_dir_counts.get(top_dir, 0) + 1
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                files.append(rel_path)
+                scanned += 1
+
+                dot = name.rfind(".")
+                ext_counts[name[dot:].lower() if 0 < dot < len(name) - 1 else "(no-ext)"] += 1
+                top_dir_counts[top_dir] += 1
+
+                lower = name.lower()
+                if name in KNOWN_MANIFESTS:
+                    manifests.append(rel_path)
+                    if name == "package.json":
+                        package_json_paths.append(rel_path)
+                if in_workflows and lower.endswith((".yml", ".yaml")):
+                    ci_workflows.append(rel_path)
+                if name == "Dockerfile" or lower.endswith(("docker-compose.yml", "docker-compose.yaml")):
+                    docker_files.append(rel_path)
+                if lower in DOC_NAMES or (
+                    lower.endswith(DOC_EXTENSIONS) and (in_docs or lower.startswith("readme"))
+                ):
+                    doc_candidates.append(rel_path)
+
+            subdirs.reverse()
+            stack.extend(subdirs)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     files.sort()
-    return files, ext_counts, top_dir_counts, truncated
+    return files, ext_counts, top_dir_counts, truncated, signals
 
 
 def parse_package_json(path: Path) -> dict[str, Any] | None:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        payload = json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return None
     if not isinstance(payload, dict):
         return None
@@ -262,31 +536,21 @@ def parse_package_json(path: Path) -> dict[str, Any] | None:
 
 def collect_manifest_details(
     project_root: Path,
-    files: list[str],
+    signals: dict[str, list[str]],
     *,
     max_package_manifests: int,
 ) -> dict[str, Any]:
-    manifests: list[str] = []
     package_manifests: list[dict[str, Any]] = []
-    ci_workflows: list[str] = []
-    docker_files: list[str] = []
     dependency_names: set[str] = set()
-    package_json_paths: list[str] = []
-
-    for rel_path in files:
-        lower = rel_path.lower()
-        name = Path(rel_path).name
-        if name in KNOWN_MANIFESTS:
-            manifests.append(rel_path)
-        if rel_path.startswith(".github/workflows/") and lower.endswith((".yml", ".yaml")):
-            ci_workflows.append(rel_path)
-        if name == "Dockerfile" or lower.endswith("docker-compose.yml") or lower.endswith("docker-compose.yaml"):
-            docker_files.append(rel_path)
-        if name == "package.json":
-            package_json_paths.append(rel_path)
-
-    for rel_path in sorted(package_json_paths)[: max(max_package_manifests, 0)]:
-        manifest = parse_package_json(project_root / rel_path)
+
+    rel_paths = sorted(signals["package_json_paths"])[: max(max_package_manifests, 0)]
+    parsed: list[dict[str, Any] | None] = []
+    if rel_paths:
+        # Reads overlap on worker threads; map() keeps results in rel_paths order.
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(rel_paths))) as pool:
+            parsed = list(pool.map(parse_package_json, [project_root / rel_path for rel_path in rel_paths]))
+
+    for rel_path, manifest in zip(rel_paths, parsed):
         if manifest is None:
             continue
         manifest["path"] = rel_path
@@ -297,45 +561,52 @@ def collect_manifest_details(
             dependency_names.add(dep.lower())
 
     return {
-        "manifests": sorted(set(manifests)),
+        "manifests": sorted(set(signals["manifests"])),
         "package_manifests": package_manifests,
-        "ci_workflows": sorted(set(ci_workflows)),
-        "docker_files": sorted(set(docker_files)),
+        "ci_workflows": sorted(set(signals["ci_workflows"])),
+        "docker_files": sorted(set(signals["docker_files"])),
         "dependency_names": sorted(dependency_names),
     }
 
 
-def collect_docs(project_root: Path, files: list[str], *, max_doc_snippets: int) -> list[dict[str, str]]:
-    candidates: list[str] = []
-    for rel_path in files:
-        lower = rel_path.lower()
-        name = Path(lower).name
-        if name.startswith("readme") and lower.endswith((".md", ".mdx", ".txt", ".rst", ".adoc")):
-            candidates.append(rel_path)
-            continue
-        if lower.startswith("docs/") and lower.endswith((".md", ".mdx", ".txt", ".rst", ".adoc")):
-            candidates.append(rel_path)
-            continue
-        if name in {"about.md", "architecture.md", "changelog.md"}:
-            candidates.append(rel_path)
+def read_doc_snippet(path: Path) -> str | None:
+    # None marks a binary file that happens to carry a doc extension; it would only add
+    # noise. Reads are already bounded, so size needs no check.
+    return safe_read_text(path, max_chars=3000)
 
-    ordered = sorted(set(candidates), key=lambda path: (0 if Path(path).name.lower().startswith("readme") else 1, path))
+
+def collect_docs(project_root: Path, candidates: list[str], *, max_doc_snippets: int) -> list[dict[str, str]]:
+    ordered = sorted(
+        set(candidates),
+        key=lambda path: (0 if path.rpartition("/")[2].lower().startswith("readme") else 1, path),
+    )
     docs: list[dict[str, str]] = []
-    for rel_path in ordered[: max(max_doc_snippets, 0)]:
-        snippet = safe_read_text(project_root / rel_path, max_chars=3000)
-        docs.append(
-            {
-                "path": rel_path,
-                "snippet": snippet,
-                "summary_sentence": first_sentence(snippet),
-            }
-        )
+    position = 0
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        # Read the next batch of candidates for the open slots in parallel; a skipped binary
+        # frees its slot for the following batch, so results match a sequential pass.
+        while len(docs) < max_doc_snippets and position < len(ordered):
+            batch = ordered[position : position + max_doc_snippets - len(docs)]
+            position += len(batch)
+            snippets = pool.map(read_doc_snippet, [project_root / rel_path for rel_path in batch])
+            for rel_path, snippet in zip(batch, snippets):
+                if snippet is None:
+                    continue
+                docs.append(
+                    {
+                        "path": rel_path,
+                        "snippet": snippet,
+                        "summary_sentence": first_sentence(snippet),
+                    }
+                )
     return docs
 
 
 def top_items(counts: dict[str, int], *, limit: int) -> list[dict[str, Any]]:
-    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
-    return [{"name": name, "count": count} for name, count in ranked[: max(limit, 0)]]
+    # Only the first `limit` entries are needed, so a bounded heap replaces a full sort.
+    # Names are unique dict keys, so ties break by name exactly as the sort did.
+    ranked = heapq.nsmallest(max(limit, 0), ((-count, name) for name, count in counts.items()))
+    return [{"name": name, "count": -negative_count} for negative_count, name in ranked]
 
 
 def collect_context(
@@ -344,17 +615,24 @@ def collect_context(
     max_scan_files: int,
     max_doc_snippets: int,
     max_package_manifests: int,
+    excluded_names: frozenset[str] = DEFAULT_EXCLUDED_DIRS,
+    excluded_path: Callable[[str], Any] | None = None,
+    dir_mtimes: dict[str, int | None] | None = None,
 ) -> dict[str, Any]:
-    files, ext_counts, top_dir_counts, truncated = iter_repo_files(
+    files, ext_counts, top_dir_counts, truncated, signals = iter_repo_files(
         project_root,
         max_scan_files=max_scan_files,
+        excluded_names=excluded_names,
+        excluded_path=excluded_path,
+        dir_mtimes=dir_mtimes,
     )
     manifest_details = collect_manifest_details(
         project_root,
-        files,
+        signals,
         max_package_manifests=max_package_manifests,
     )
-    docs = collect_docs(project_root, files, max_doc_snippets=max_doc_snippets)
+    docs = collect_docs(project_root, signals["doc_candidates"], max_doc_snippets=max_doc_snippets)
+    top_directories = top_items(top_dir_counts, limit=16)
 
     return {
         "captured_at": utc_now(),
@@ -364,7 +642,7 @@ def collect_context(
             "truncated": truncated,
         },
         "inventory": {
-            "top_directories": top_items(top_dir_counts, limit=16),
+            "top_directories": top_directories,
             "top_extensions": top_items(ext_counts, limit=16),
             "manifests": manifest_details["manifests"],
             "package_manifests": manifest_details["package_manifests"],
@@ -375,7 +653,7 @@ def collect_context(
         "docs": docs,
         "suggested_entrypoints": {
             "docs": [entry["path"] for entry in docs[:5]],
-            "directories": [entry["name"] for entry in top_items(top_dir_counts, limit=8)],
+            "directories": [entry["name"] for entry in top_directories[:8]],
             "manifests": manifest_details["manifests"][:12],
         },
     }
@@ -387,17 +665,18 @@ def parse_payload(args: argparse.Namespace, project_root: Path) -> dict[str, Any
         if not file_path.is_absolute():
             file_path = (project_root / file_path).resolve()
         try:
-            raw = file_path.read_text(encoding="utf-8")
+            raw = file_path.read_bytes()
         except OSError as exc:
             raise ValueError(f"PAYLOAD_READ_FAILED: {exc}") from exc
     elif args.json:
         raw = args.json
     else:
-        raw = sys.stdin.read()
+        # json.loads detects the UTF encoding of raw bytes itself, so stdin skips the text layer.
+        raw = sys.stdin.buffer.read()
 
     try:
         payload = json.loads(raw)
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"INVALID_PAYLOAD_JSON: {exc}") from exc
 
     if not isinstance(payload, dict):
@@ -405,12 +684,22 @@ def parse_payload(args: argparse.Namespace, project_root: Path) -> dict[str, Any
     return payload
 
 
+def _slug_text(value: Any) -> str:
+    # Same result as re.sub(r"[^a-z0-9]+", "-", ...).strip("-"): every code point outside
+    # [a-z0-9] (non-ASCII ones become "?" first) maps to "-", then runs of "-" collapse.
+    token = str(value).lower().encode("ascii", "replace").translate(_SLUG_TABLE).decode("ascii")
+    while "--" in token:
+        token = token.replace("--", "-")
+    return token.strip("-")
+
+
 def _slug_token(value: Any, fallback: str) -> str:
-    token = re.sub(r"[^a-z0-9]+", "-", str(value).strip().lower()).strip("-")
+    # Slugs are the entity and clone ids used as keys across the repair maps and sets;
+    # interning lets repeated lookups of the same id compare by identity.
+    token = _slug_text(value)
     if token:
-        return token
-    fallback_token = re.sub(r"[^a-z0-9]+", "-", str(fallback).strip().lower()).strip("-")
-    return fallback_token or "item"
+        return sys.intern(token)
+    return sys.intern(_slug_text(fallback) or "item")
 
 
 def _coerce_text_list(value: Any) -> list[str]:
@@ -421,12 +710,8 @@ def _coerce_text_list(value: Any) -> list[str]:
     else:
         raw = [value]
 
-    values: list[str] = []
-    for item in raw:
-        text = str(item).strip()
-        if text and text not in values:
-            values.append(text)
-    return values
+    # dict.fromkeys keeps first-seen order and dedupes in linear time.
+    return list(dict.fromkeys(text for text in (str(item).strip() for item in raw) if text))
 
 
 def _unique_token(seed: str, used: set[str]) -> str:
@@ -435,6 +720,7 @@ def _unique_token(seed: str, used: set[str]) -> str:
     while candidate in used:
         candidate = f"{seed}-{index}"
         index += 1
+    candidate = sys.intern(candidate)
     used.add(candidate)
     return candidate
 
@@ -446,6 +732,66 @@ def _normalized_aliases(label: str, aliases: Any) -> list[str]:
     return values
 
 
+def _entity_links_are_clean(blocks: list[Any], entity_registry: Any) -> bool:
+    # True only when repair_research_entity_links would leave the payload untouched: stripped
+    # block ids, registry entries already in their rebuilt form, and every topic reference
+    # naming a registry entity owned by the topic's own block.
+    if not isinstance(entity_registry, list):
+        return False
+
+    block_ids: set[str] = set()
+    for block in blocks:
+        if not isinstance(block, dict):
+            continue
+        block_id = block.get("block_id")
+        if not isinstance(block_id, str) or not block_id or block_id != block_id.strip():
+            return False
+        block_ids.add(block_id)
+
+    owners: dict[str, str] = {}
+    for entry in entity_registry:
+        if not isinstance(entry, dict) or tuple(entry) != ENTITY_FIELDS:
+            return False
+        entity_id = entry["entity_id"]
+        label = entry["label"]
+        kind = entry["kind"]
+        aliases = entry["aliases"]
+        owner_block_id = entry["owner_block_id"]
+        if not isinstance(entity_id, str) or not entity_id or entity_id in owners:
+            return False
+        if _slug_text(entity_id) != entity_id:
+            return False
+        if not isinstance(label, str) or not label or label != label.strip():
+            return False
+        if not isinstance(kind, str) or not kind or kind != kind.strip():
+            return False
+        if not isinstance(aliases, list) or _normalized_aliases(label, aliases) != aliases:
+            return False
+        if not isinstance(owner_block_id, str) or (owner_block_id and owner_block_id not in block_ids):
+            return False
+        owners[entity_id] = owner_block_id
+
+    for block in blocks:
+        if not isinstance(block, dict):
+            continue
+        topics = block.get("topics")
+        if not isinstance(topics, list):
+            continue
+        block_id = block["block_id"]
+        for topic in topics:
+            if not isinstance(topic, dict):
+                continue
+            related = topic.get("related_entities")
+            if not isinstance(related, list):
+                return False
+            for entity_id in related:
+                if not isinstance(entity_id, str) or owners.get(entity_id) != block_id:
+                    return False
+            if len(set(related)) != len(related):
+                return False
+    return True
+
+
 def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
     """Auto-repair cross-block entity references to reduce avoidable validation failures."""
 
@@ -465,14 +811,16 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
     blocks = agenda.get("blocks")
     if not isinstance(blocks, list):
         return repairs
+    if _entity_links_are_clean(blocks, agenda.get("entity_registry")):
+        return repairs
 
     block_ids: list[str] = []
     for index, block in enumerate(blocks, start=1):
         if not isinstance(block, dict):
             continue
-        block_id = str(block.get("block_id", "")).strip()
+        block_id = sys.intern(str(block.get("block_id", "")).strip())
         if not block_id:
-            block_id = f"block-{index}"
+            block_id = sys.intern(f"block-{index}")
             block["block_id"] = block_id
             repairs["generated_block_ids"] += 1
         block_ids.append(block_id)
@@ -487,12 +835,15 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
     used_entity_ids: set[str] = set()
     entity_index: dict[str, dict[str, Any]] = {}
     entity_order: list[str] = []
+    # Registry entries without a label get one derived from their id, so only their aliases
+    # still need the label folded in; every other entity is built already normalized.
+    unlabeled_entity_ids: set[str] = set()
 
     for index, raw_entry in enumerate(entity_registry_raw, start=1):
         entry = dict(raw_entry) if isinstance(raw_entry, dict) else {"label": raw_entry}
         label = str(entry.get("label") or entry.get("name") or entry.get("entity_id") or entry.get("id") or "").strip()
         seed = _slug_token(entry.get("entity_id") or entry.get("id") or label, f"entity-{index}")
-        owner_block_id = str(entry.get("owner_block_id") or entry.get("owner") or "").strip()
+        owner_block_id = sys.intern(str(entry.get("owner_block_id") or entry.get("owner") or "").strip())
         kind = str(entry.get("kind") or entry.get("type") or "entity").strip() or "entity"
         aliases = _normalized_aliases(label, entry.get("aliases"))
 
@@ -507,9 +858,7 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
             else:
                 if not existing_owner and owner_block_id:
                     existing["owner_block_id"] = owner_block_id
-                for alias in aliases:
-                    if alias not in existing["aliases"]:
-                        existing["aliases"].append(alias)
+                existing["aliases"] = list(dict.fromkeys([*existing["aliases"], *aliases]))
                 continue
         else:
             seed = _unique_token(seed, used_entity_ids)
@@ -523,6 +872,8 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
         }
         entity_index[seed] = entity
         entity_order.append(seed)
+        if not label:
+            unlabeled_entity_ids.add(seed)
 
     clone_cache: dict[tuple[str, str], str] = {}
     synthetic_index = 0
@@ -530,7 +881,7 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
     for block_index, block in enumerate(blocks, start=1):
         if not isinstance(block, dict):
             continue
-        block_id = str(block.get("block_id") or f"block-{block_index}").strip()
+        block_id = sys.intern(str(block.get("block_id") or f"block-{block_index}").strip())
         topics = block.get("topics")
         topics = topics if isinstance(topics, list) else []
 
@@ -599,11 +950,7 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
 
                 repaired_related.append(entity_id)
 
-            deduped_related: list[str] = []
-            for entity_id in repaired_related:
-                if entity_id not in deduped_related:
-                    deduped_related.append(entity_id)
-            topic["related_entities"] = deduped_related
+            topic["related_entities"] = list(dict.fromkeys(repaired_related))
 
     for entity_id in entity_order:
         entity = entity_index.get(entity_id)
@@ -613,10 +960,10 @@ def repair_research_entity_links(payload: dict[str, Any]) -> dict[str, Any]:
         if owner_block_id and owner_block_id not in block_id_set:
             entity["owner_block_id"] = ""
             repairs["unknown_owner_resets"] += 1
-        entity["aliases"] = _normalized_aliases(str(entity.get("label", "")).strip(), entity.get("aliases"))
-        entity["kind"] = str(entity.get("kind", "")).strip() or "entity"
+        if entity_id in unlabeled_entity_ids:
+            entity["aliases"] = _normalized_aliases(str(entity.get("label", "")).strip(), entity.get("aliases"))
 
-    agenda["entity_registry"] = [entity_index[entity_id] for entity_id in entity_order]
+    agenda["entity_registry"] = list(map(entity_index.__getitem__, entity_order))
     payload["research_agenda"] = agenda
 
     repairs["applied"] = any(
@@ -668,22 +1015,13 @@ def complete_flow(args: argparse.Namespace, project_root: Path, data: dict[str,
     state["ideation-completed"] = True
     state["research-completed"] = False
 
-    data, _ = set_workflow_item_status(
+    data, _ = set_workflow_items(
         data,
-        item_id="task-brownfield-documentation",
-        status="complete",
-        cadence_dir_exists=True,
-    )
-    data, _ = set_workflow_item_status(
-        data,
-        item_id="task-ideation",
-        status="skipped",
-        cadence_dir_exists=True,
-    )
-    data, _ = set_workflow_item_status(
-        data,
-        item_id="task-research",
-        status="pending",
+        [
+            ("task-brownfield-documentation", "complete"),
+            ("task-ideation", "skipped"),
+            ("task-research", "pending"),
+        ],
         cadence_dir_exists=True,
     )
     data = reconcile_workflow_state(data, cadence_dir_exists=True)
@@ -707,22 +1045,116 @@ def complete_flow(args: argparse.Namespace, project_root: Path, data: dict[str,
     }
 
 
+def discovery_inputs(context: dict[str, Any], *, max_package_manifests: int) -> list[str]:
+    # Files whose contents are copied into the context: doc snippets and parsed package.json manifests.
+    docs = [str(entry.get("path", "")) for entry in context.get("docs", [])]
+    manifests = context.get("inventory", {}).get("manifests", [])
+    package_json_paths = sorted(path for path in manifests if path.rsplit("/", 1)[-1] == "package.json")
+    return docs + package_json_paths[:max_package_manifests]
+
+
+def directory_mtimes(project_root: Path, rel_dirs: list[str]) -> dict[str, int | None]:
+    mtimes: dict[str, int | None] = {}
+    for rel_dir in rel_dirs:
+        try:
+            mtimes[rel_dir] = os.stat(project_root / rel_dir).st_mtime_ns
+        except OSError:
+            mtimes[rel_dir] = None
+    return mtimes
+
+
+def discovery_fingerprint(
+    project_root: Path,
+    limits: list[Any],
+    dir_mtimes: dict[str, int | None],
+    inputs: list[str],
+) -> str:
+    # The mtime of every directory the scan listed catches added, removed or renamed entries
+    # at any depth; (mtime, size) of each input file catches edits to content copied into the
+    # context. Only stat calls are needed, so a lookup never reads file contents.
+    parts: list[Any] = [limits, sorted(dir_mtimes.items())]
+    for rel_path in inputs:
+        try:
+            file_stat = os.stat(project_root / rel_path)
+        except OSError:
+            parts.append([rel_path, None])
+            continue
+        parts.append([rel_path, file_stat.st_mtime_ns, file_stat.st_size])
+    return hashlib.blake2b(json.dumps(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_discovery_cache(project_root: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads((project_root / DISCOVERY_CACHE_REL).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def save_discovery_cache(project_root: Path, payload: dict[str, Any]) -> None:
+    try:
+        write_bytes_atomic(project_root / DISCOVERY_CACHE_REL, json.dumps(payload).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+
+
 def discover_flow(args: argparse.Namespace, project_root: Path, data: dict[str, Any]) -> dict[str, Any]:
     ensure_brownfield_mode(data)
-    context = collect_context(
-        project_root,
-        max_scan_files=max(args.max_scan_files, 400),
-        max_doc_snippets=max(args.max_doc_snippets, 1),
-        max_package_manifests=max(args.max_package_manifests, 1),
-    )
-    return {
+    max_scan_files = max(args.max_scan_files, 400)
+    max_doc_snippets = max(args.max_doc_snippets, 1)
+    max_package_manifests = max(args.max_package_manifests, 1)
+    response: dict[str, Any] = {
         "status": "ok",
         "mode": "brownfield",
         "action": "discover",
         "project_root": str(project_root),
-        "context": context,
     }
 
+    use_gitignore = bool(args.gitignore)
+    gitignore_rules = load_gitignore_rules(project_root) if use_gitignore else []
+    limits = [max_scan_files, max_doc_snippets, max_package_manifests, sorted(args.exclude), use_gitignore]
+    if args.cache:
+        cached = load_discovery_cache(project_root)
+        directories = cached.get("directories")
+        inputs = cached.get("inputs")
+        context = cached.get("context")
+        if isinstance(directories, list) and isinstance(inputs, list) and isinstance(context, dict):
+            fingerprint = discovery_fingerprint(
+                project_root,
+                limits,
+                directory_mtimes(project_root, [str(path) for path in directories]),
+                [str(path) for path in inputs],
+            )
+            if fingerprint == cached.get("fingerprint"):
+                response["context"] = context
+                response["cache_hit"] = True
+                return response
+
+    excluded_names, excluded_path = compile_dir_excludes(args.exclude, gitignore_rules)
+    dir_mtimes: dict[str, int | None] | None = {} if args.cache else None
+    context = collect_context(
+        project_root,
+        max_scan_files=max_scan_files,
+        max_doc_snippets=max_doc_snippets,
+        max_package_manifests=max_package_manifests,
+        excluded_names=excluded_names,
+        excluded_path=excluded_path,
+        dir_mtimes=dir_mtimes,
+    )
+    response["context"] = context
+    if dir_mtimes is not None:
+        inputs = discovery_inputs(context, max_package_manifests=max_package_manifests)
+        if use_gitignore:
+            inputs.append(GITIGNORE_NAME)
+        # Directory mtimes come from the walk itself, so a change made mid-scan forces a rescan next time.
+        fingerprint = discovery_fingerprint(project_root, limits, dir_mtimes, inputs)
+        save_discovery_cache(
+            project_root,
+            {"fingerprint": fingerprint, "directories": list(dir_mtimes), "inputs": inputs, "context": context},
+        )
+        response["cache_hit"] = False
+    return response
+
 
 def main() -> int:
     args = parse_args()
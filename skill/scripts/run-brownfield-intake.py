@@ -4,14 +4,18 @@
 from __future__ import annotations
 
 import argparse
+from collections import Counter
+import heapq
 from datetime import datetime, timezone
 import json
 import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from atomic_write import write_bytes_atomic
+from brownfield_scan import SKIP_FILENAMES
 from project_root import resolve_project_root, write_project_root_hint
 from workflow_state import default_data, reconcile_workflow_state, set_workflow_item_status
 
@@ -20,7 +24,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 ROUTE_GUARD_SCRIPT = SCRIPT_DIR / "assert-workflow-route.py"
 CADENCE_JSON_REL = Path(".cadence") / "cadence.json"
 
-DEFAULT_EXCLUDED_DIRS = {
+DEFAULT_EXCLUDED_DIRS = frozenset({
     ".cadence",
     ".git",
     ".hg",
@@ -36,9 +40,9 @@ DEFAULT_EXCLUDED_DIRS = {
     "dist",
     "build",
     "coverage",
-}
+})
 
-KNOWN_MANIFESTS = {
+KNOWN_MANIFESTS = frozenset({
     "package.json",
     "pnpm-workspace.yaml",
     "yarn.lock",
@@ -62,9 +66,9 @@ KNOWN_MANIFESTS = {
     "docker-compose.yml",
     "docker-compose.yaml",
     "Dockerfile",
-}
+})
 
-NON_SIGNAL_TOP_LEVEL_FILES = {
+NON_SIGNAL_TOP_LEVEL_FILES = frozenset({
     ".gitignore",
     ".gitattributes",
     ".editorconfig",
@@ -84,7 +88,7 @@ NON_SIGNAL_TOP_LEVEL_FILES = {
     "LICENSE.txt",
     "COPYING",
     "CODEOWNERS",
-}
+})
 
 
 def parse_args() -> argparse.Namespace:
@@ -172,7 +176,7 @@ def load_state(project_root: Path) -> dict[str, Any]:
 def save_state(project_root: Path, data: dict[str, Any]) -> None:
     path = cadence_json_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=4) + "\n", encoding="utf-8")
+    write_bytes_atomic(path, json.dumps(data, indent=4).encode("utf-8") + b"\n")
 
 
 def detect_git_details(project_root: Path) -> dict[str, Any]:
@@ -218,10 +222,19 @@ def detect_git_details(project_root: Path) -> dict[str, Any]:
 
 
 def is_meaningful_inventory_path(rel_path: str) -> bool:
-    path = Path(rel_path)
-    if len(path.parts) > 1:
+    if "/" in rel_path:
         return True
-    return path.name not in NON_SIGNAL_TOP_LEVEL_FILES
+    return rel_path not in NON_SIGNAL_TOP_LEVEL_FILES
+
+
+def walk_project(project_root: Path) -> Iterator[tuple[str, list[str], list[str]]]:
+    # fwalk resolves each directory relative to its parent's descriptor; it is POSIX-only,
+    # so other platforms keep os.walk. Both walk top-down and honour in-place dirs pruning.
+    if hasattr(os, "fwalk"):
+        for root, dirs, files, _root_fd in os.fwalk(project_root, topdown=True, follow_symlinks=False):
+            yield root, dirs, files
+    else:
+        yield from os.walk(project_root, topdown=True, followlinks=False)
 
 
 def iter_inventory_paths(project_root: Path, *, max_files: int) -> tuple[list[str], int, int, int]:
@@ -230,15 +243,18 @@ def iter_inventory_paths(project_root: Path, *, max_files: int) -> tuple[list[st
     directory_count = 0
     meaningful_file_count = 0
 
-    for root, dirs, files in os.walk(project_root):
-        rel_root = Path(root).resolve().relative_to(project_root)
+    # os.walk/os.fwalk yield roots as joined strings, so relative paths are sliced off the
+    # root prefix instead of building and resolving a Path for every directory and file.
+    root_prefix_len = len(os.path.join(str(project_root), ""))
+    for root, dirs, files in walk_project(project_root):
+        rel_root = root[root_prefix_len:].replace(os.sep, "/")
         dirs[:] = [name for name in dirs if name not in DEFAULT_EXCLUDED_DIRS]
         directory_count += len(dirs)
 
         for filename in files:
-            if filename.startswith(".DS_Store"):
+            if filename in SKIP_FILENAMES or filename.startswith(".DS_Store"):
                 continue
-            rel_path = (rel_root / filename).as_posix() if str(rel_root) != "." else filename
+            rel_path = f"{rel_root}/{filename}" if rel_root else filename
             file_count += 1
             if is_meaningful_inventory_path(rel_path):
                 meaningful_file_count += 1
@@ -249,24 +265,24 @@ def iter_inventory_paths(project_root: Path, *, max_files: int) -> tuple[list[st
     return file_paths, file_count, directory_count, meaningful_file_count
 
 
+def path_extension(rel_path: str) -> str:
+    name = rel_path.rpartition("/")[2]
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else "(no-ext)"
+
+
 def infer_languages(file_paths: list[str]) -> list[dict[str, Any]]:
-    extension_counts: dict[str, int] = {}
-    for rel_path in file_paths:
-        suffix = Path(rel_path).suffix.lower()
-        ext = suffix if suffix else "(no-ext)"
-        extension_counts[ext] = extension_counts.get(ext, 0) + 1
+    # Counter tallies in C instead of a dict.get() + store per file.
+    extension_counts = Counter(map(path_extension, file_paths))
 
-    ranked = sorted(
-        extension_counts.items(),
-        key=lambda item: (-item[1], item[0]),
-    )
-    return [{"extension": ext, "count": count} for ext, count in ranked[:8]]
+    ranked = heapq.nsmallest(8, ((-count, ext) for ext, count in extension_counts.items()))
+    return [{"extension": ext, "count": -negative_count} for negative_count, ext in ranked]
 
 
 def collect_manifests(file_paths: list[str]) -> list[str]:
     manifests: list[str] = []
     for rel_path in file_paths:
-        name = Path(rel_path).name
+        name = rel_path.rpartition("/")[2]
         if name in KNOWN_MANIFESTS and rel_path not in manifests:
             manifests.append(rel_path)
     manifests.sort()
@@ -311,7 +327,7 @@ def parse_test_commands(project_root: Path) -> list[str]:
 
 def detect_monorepo(project_root: Path, manifests: list[str]) -> bool:
     indicator_files = {"pnpm-workspace.yaml", "lerna.json", "nx.json", "turbo.json"}
-    manifest_names = {Path(path).name for path in manifests}
+    manifest_names = {path.rpartition("/")[2] for path in manifests}
     if indicator_files.intersection(manifest_names):
         return True
 
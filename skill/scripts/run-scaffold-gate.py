@@ -66,13 +66,18 @@ def run_scaffold(project_root: Path):
 
 
 def initialize_scripts_dir(project_root: Path):
-    result = run_command(
+    # Only stderr is reported on failure; the init script's JSON stdout is discarded unread.
+    result = subprocess.run(
         [
             sys.executable,
             str(INIT_SCRIPT),
             "--project-root",
             str(project_root),
-        ]
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
     )
     if result.returncode != 0:
         stderr = result.stderr.strip() or "INIT_CADENCE_SCRIPTS_DIR_FAILED"
@@ -933,6 +933,53 @@ def set_workflow_item_status(
     return reconciled, True
 
 
+def set_workflow_items(
+    data: dict[str, Any],
+    updates: list[tuple[str, str]],
+    *,
+    cadence_dir_exists: bool,
+) -> tuple[dict[str, Any], bool]:
+    """Apply updates as successive set_workflow_item_status calls would, or none if any id is unknown."""
+
+    normalized_updates: list[tuple[str, str]] = []
+    for item_id, status in updates:
+        normalized_status = str(status).strip().lower()
+        if normalized_status not in VALID_STATUSES:
+            raise ValueError(f"Unsupported status '{status}'.")
+        normalized_updates.append((str(item_id).strip(), normalized_status))
+
+    reconciled = reconcile_workflow_state(data, cadence_dir_exists=cadence_dir_exists)
+    workflow_seed = reconciled.get("workflow")
+    plan = _normalize_plan(workflow_seed.get("plan") if isinstance(workflow_seed, dict) else None)
+    # Unknown ids leave the data untouched, as if no update had been applied.
+    for item_id, _ in normalized_updates:
+        if not item_id or _find_item_by_id(plan, item_id) is None:
+            return reconciled, False
+
+    # Each update repeats the full set_workflow_item_status sequence: reconcile is not
+    # idempotent on intermediate states, so skipping any pass would change the result.
+    for index, (item_id, status) in enumerate(normalized_updates):
+        if index:
+            reconciled = reconcile_workflow_state(reconciled, cadence_dir_exists=cadence_dir_exists)
+        workflow_seed = reconciled.get("workflow")
+        workflow_seed = dict(workflow_seed) if isinstance(workflow_seed, dict) else {}
+        plan = _normalize_plan(workflow_seed.get("plan"))
+        _set_item_status(plan, item_id, status)
+        _roll_up_plan(plan)
+        _sync_legacy_flags_from_plan(reconciled, plan)
+        workflow_seed["plan"] = plan
+        reconciled["workflow"] = workflow_seed
+        reconciled = reconcile_workflow_state(reconciled, cadence_dir_exists=cadence_dir_exists)
+    return reconciled, True
+
+    _roll_up_plan(plan)
+    _sync_legacy_flags_from_plan(reconciled, plan)
+    workflow_seed["plan"] = plan
+    reconciled["workflow"] = workflow_seed
+    reconciled = reconcile_workflow_state(reconciled, cadence_dir_exists=cadence_dir_exists)
+    return reconciled, all_found
+
+
 def route_for_next_phase(next_phase: str) -> dict[str, str]:
     """Compatibility helper retained for callers using legacy next_phase names."""
 
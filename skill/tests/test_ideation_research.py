@@ -9,6 +9,7 @@ if str(SCRIPTS_DIR) not in sys.path:
 
 from ideation_research import (
     ResearchAgendaValidationError,
+    count_ideation_research,
     ensure_ideation_research_defaults,
     normalize_ideation_research,
 )
@@ -145,6 +146,35 @@ class IdeationResearchNormalizationTests(unittest.TestCase):
 
         self.assertEqual(block_b_topic["related_entities"], ["entity-marketplace-fees"])
 
+    def test_count_matches_normalized_summary_without_touching_payload(self) -> None:
+        payload = base_payload()
+        payload["research_agenda"]["blocks"][0]["topics"][0]["related_entities"] = ["Marketplace Fees"]
+        original = copy.deepcopy(payload)
+
+        counts = count_ideation_research(payload, require_topics=True)
+        summary = normalize_ideation_research(copy.deepcopy(original), require_topics=True)["research_agenda"][
+            "summary"
+        ]
+
+        self.assertEqual(counts, (summary["block_count"], summary["topic_count"], summary["entity_count"]))
+        self.assertEqual(counts, (2, 2, 1))
+        self.assertEqual(payload, original)
+
+    def test_count_applies_structural_checks_only(self) -> None:
+        payload = base_payload()
+        payload["research_agenda"]["blocks"][1]["topics"][0]["related_entities"] = ["entity-fees"]
+        payload["research_agenda"]["entity_registry"] = [
+            {"entity_id": "entity-fees", "label": "Fees", "owner_block_id": "block-a"}
+        ]
+        self.assertEqual(count_ideation_research(payload, require_topics=True), (2, 2, 1))
+
+        for block in payload["research_agenda"]["blocks"]:
+            block["topics"] = []
+        with self.assertRaises(ResearchAgendaValidationError) as ctx:
+            count_ideation_research(payload, require_topics=True)
+        self.assertIn("RESEARCH_TOPICS_REQUIRED", str(ctx.exception))
+        self.assertEqual(count_ideation_research(payload, require_topics=False), (2, 0, 1))
+
     def test_execution_normalization_supports_caveated_completion_and_planning_caps(self) -> None:
         payload = base_payload()
         payload["research_execution"] = {
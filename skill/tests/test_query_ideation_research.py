@@ -99,6 +99,44 @@ class QueryIdeationResearchTests(unittest.TestCase):
             self.assertEqual(Path(payload["path"]).resolve(), payload_path.resolve())
             self.assertEqual(payload["summary"]["matched_topics"], 1)
 
+    def test_output_is_compact_by_default_and_indented_with_pretty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            payload_path = Path(tmp_dir) / "ideation.json"
+            payload_path.write_text(json.dumps(build_ideation_payload(), indent=4) + "\n", encoding="utf-8")
+
+            outputs = {}
+            for extra_args in ([], ["--pretty"]):
+                result = subprocess.run(
+                    [sys.executable, str(RUN_SCRIPT), "--file", str(payload_path), *extra_args],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                self.assertEqual(result.returncode, 0, msg=result.stderr or result.stdout)
+                outputs[bool(extra_args)] = result.stdout
+
+            self.assertEqual(outputs[False].count("\n"), 1)
+            self.assertIn('\n    "status": "ok"', outputs[True])
+            self.assertEqual(json.loads(outputs[False]), json.loads(outputs[True]))
+
+    def test_text_filter_matches_within_and_across_searchable_fields(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            payload_path = Path(tmp_dir) / "ideation.json"
+            payload_path.write_text(json.dumps(build_ideation_payload(), indent=4) + "\n", encoding="utf-8")
+
+            matched_counts = {}
+            for text in ("ONE", "one general", "missing"):
+                result = subprocess.run(
+                    [sys.executable, str(RUN_SCRIPT), "--file", str(payload_path), "--text", text],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                self.assertEqual(result.returncode, 0, msg=result.stderr or result.stdout)
+                matched_counts[text] = json.loads(result.stdout)["summary"]["matched_topics"]
+
+            self.assertEqual(matched_counts, {"ONE": 1, "one general": 1, "missing": 0})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+RUN_SCRIPT = SCRIPTS_DIR / "query-json-fuzzy.py"
+
+
+def build_payload() -> dict:
+    return {
+        "ideation": {
+            "objective": "Pricing research",
+            "research_agenda": {
+                "blocks": [
+                    {"title": "Pricing tiers", "tags": ["pricing"]},
+                    {"title": "Onboarding flow", "tags": ["growth"]},
+                ]
+            },
+        },
+        "notes": {"title": "Pricing notes"},
+    }
+
+
+class QueryJsonFuzzyTests(unittest.TestCase):
+    def run_query_raw(self, payload: dict, *args: str) -> str:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            payload_path = Path(tmp_dir) / "payload.json"
+            payload_path.write_text(json.dumps(payload), encoding="utf-8")
+            result = subprocess.run(
+                [sys.executable, str(RUN_SCRIPT), "--file", str(payload_path), *args],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        self.assertEqual(result.returncode, 0, msg=result.stderr or result.stdout)
+        return result.stdout
+
+    def run_query(self, payload: dict, *args: str) -> dict:
+        return json.loads(self.run_query_raw(payload, *args))
+
+    def test_output_is_compact_by_default_and_indented_with_pretty(self) -> None:
+        compact = self.run_query_raw(build_payload(), "--text", "pricing")
+        pretty = self.run_query_raw(build_payload(), "--text", "pricing", "--pretty")
+
+        self.assertEqual(compact.count("\n"), 1)
+        self.assertIn('\n    "status": "ok"', pretty)
+        compact_payload = json.loads(compact)
+        pretty_payload = json.loads(pretty)
+        # Each run writes the payload to its own temporary directory.
+        compact_payload.pop("path")
+        pretty_payload.pop("path")
+        self.assertEqual(compact_payload, pretty_payload)
+
+    def test_dotted_field_patterns_match_only_reachable_paths(self) -> None:
+        response = self.run_query(
+            build_payload(),
+            "--text",
+            "pricing",
+            "--field",
+            "ideation.research_agenda.*.title",
+        )
+
+        self.assertEqual(
+            [item["path"] for item in response["results"]],
+            ["ideation.research_agenda.blocks[0].title"],
+        )
+        # Every scalar is still counted, including those off the --field path.
+        self.assertEqual(response["summary"]["candidates_scanned"], 6)
+
+    def test_dotted_field_pattern_matches_bare_dotted_key_off_path(self) -> None:
+        response = self.run_query(
+            {"userId": {"b.c": "Search"}},
+            "--text",
+            "search",
+            "--field",
+            "b.c",
+        )
+
+        self.assertEqual([item["path"] for item in response["results"]], ["userId.b.c"])
+        self.assertEqual(response["results"][0]["score"], 1.0)
+        self.assertEqual(response["summary"]["candidates_considered"], 1)
+
+    def test_bare_key_pattern_still_scans_every_subtree(self) -> None:
+        response = self.run_query(
+            build_payload(),
+            "--text",
+            "pricing",
+            "--field",
+            "ideation.research_agenda.*.title",
+            "--field",
+            "title",
+        )
+
+        self.assertEqual(
+            [item["path"] for item in response["results"]],
+            ["ideation.research_agenda.blocks[0].title", "notes.title"],
+        )
+        self.assertEqual(response["summary"]["candidates_scanned"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -139,6 +139,23 @@ def build_cross_block_entity_payload() -> dict:
 
 
 class RunBrownfieldDocumentationTests(unittest.TestCase):
+    def discover(self, project_root: Path, *extra_args: str) -> dict:
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(RUN_DOC_SCRIPT),
+                "--project-root",
+                str(project_root),
+                "discover",
+                *extra_args,
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr or result.stdout)
+        return json.loads(result.stdout)
+
     def test_discover_is_read_only_and_returns_context(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             project_root = Path(tmp_dir)
@@ -188,6 +205,144 @@ class RunBrownfieldDocumentationTests(unittest.TestCase):
             cadence_files = sorted(path.name for path in cadence_dir.iterdir() if path.is_file())
             self.assertEqual(cadence_files, ["cadence.json"])
 
+    def test_discover_cache_reuses_context_until_inputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            (cadence_dir / "cadence.json").write_text(
+                json.dumps(build_doc_ready_state(), indent=4) + "\n",
+                encoding="utf-8",
+            )
+            readme = project_root / "README.md"
+            readme.write_text("# App\n\nExisting brownfield project.\n", encoding="utf-8")
+
+            first = self.discover(project_root, "--cache")
+            second = self.discover(project_root, "--cache")
+            readme.write_text("# App\n\nRewritten brownfield project summary.\n", encoding="utf-8")
+            third = self.discover(project_root, "--cache")
+
+            self.assertFalse(first["cache_hit"])
+            self.assertTrue((cadence_dir / "brownfield-discovery-cache.json").is_file())
+            self.assertTrue(second["cache_hit"])
+            self.assertEqual(second["context"], first["context"])
+            self.assertFalse(third["cache_hit"])
+            self.assertIn("Rewritten", third["context"]["docs"][0]["snippet"])
+
+    def test_discover_cache_misses_when_nested_entries_are_added(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            (cadence_dir / "cadence.json").write_text(
+                json.dumps(build_doc_ready_state(), indent=4) + "\n",
+                encoding="utf-8",
+            )
+            package_dir = project_root / "packages" / "a"
+            package_dir.mkdir(parents=True)
+            (package_dir / "package.json").write_text(json.dumps({"name": "a"}) + "\n", encoding="utf-8")
+
+            first = self.discover(project_root, "--cache")
+            (package_dir / "sub").mkdir()
+            (package_dir / "sub" / "package.json").write_text(json.dumps({"name": "sub"}) + "\n", encoding="utf-8")
+            second = self.discover(project_root, "--cache")
+
+            self.assertFalse(first["cache_hit"])
+            self.assertFalse(second["cache_hit"])
+            self.assertEqual(
+                second["context"]["inventory"]["manifests"],
+                ["packages/a/package.json", "packages/a/sub/package.json"],
+            )
+            self.assertFalse(any(path.name.startswith(".brownfield") for path in cadence_dir.iterdir()))
+
+    def test_discover_prunes_gitignored_and_excluded_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            (cadence_dir / "cadence.json").write_text(
+                json.dumps(build_doc_ready_state(), indent=4) + "\n",
+                encoding="utf-8",
+            )
+            (project_root / ".gitignore").write_text("# build output\n/generated/\n*.egg-info/\n", encoding="utf-8")
+            for rel_path in (
+                "src/app.py",
+                "generated/out.py",
+                "src/pkg.egg-info/PKG-INFO",
+                "vendor/lib.py",
+                "src/generated/keep.py",
+            ):
+                path = project_root / rel_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("x\n", encoding="utf-8")
+
+            def top_directories(*extra_args: str) -> dict:
+                inventory = self.discover(project_root, *extra_args)["context"]["inventory"]
+                return {entry["name"]: entry["count"] for entry in inventory["top_directories"]}
+
+            self.assertEqual(
+                top_directories(),
+                {"src": 3, "generated": 1, "vendor": 1, "(root)": 1},
+            )
+            self.assertEqual(top_directories("--gitignore", "--exclude", "vendor"), {"src": 2, "(root)": 1})
+
+    def test_discover_gitignore_handles_wildcards_negation_and_escapes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            (cadence_dir / "cadence.json").write_text(
+                json.dumps(build_doc_ready_state(), indent=4) + "\n",
+                encoding="utf-8",
+            )
+            for rel_path in (
+                "src/app.py",
+                "src/cache/blob.bin",
+                "docs/guide.md",
+                "#notes/todo.md",
+                "!keep/readme.md",
+                "logs/run.log",
+            ):
+                path = project_root / rel_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("x\n", encoding="utf-8")
+            gitignore = project_root / ".gitignore"
+
+            def scanned_directories(rules: str) -> list[str]:
+                gitignore.write_text(rules, encoding="utf-8")
+                inventory = self.discover(project_root, "--gitignore")["context"]["inventory"]
+                return sorted(entry["name"] for entry in inventory["top_directories"])
+
+            # A bare "*" ignores everything; "!" lines re-include, and the last matching line wins.
+            self.assertEqual(scanned_directories("*\n"), ["(root)"])
+            self.assertEqual(scanned_directories("*\n!src/\n!docs\n"), ["(root)", "docs", "src"])
+            self.assertEqual(
+                scanned_directories("*/\n!*/\nlogs/\n"),
+                sorted(["!keep", "#notes", "(root)", "docs", "src"]),
+            )
+            # Escaped "#" and "!" are literal names, not a comment or a negation.
+            self.assertEqual(
+                scanned_directories("#notes\n\\#notes\n\\!keep\n"),
+                sorted(["docs", "logs", "src", "(root)"]),
+            )
+
+    def test_discover_skips_binary_doc_candidates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            (cadence_dir / "cadence.json").write_text(
+                json.dumps(build_doc_ready_state(), indent=4) + "\n",
+                encoding="utf-8",
+            )
+            (project_root / "README.md").write_text("# App\n\nExisting brownfield project.\n", encoding="utf-8")
+            (project_root / "docs").mkdir(parents=True, exist_ok=True)
+            (project_root / "docs" / "diagram.md").write_bytes(b"PK\x03\x04\x00\x00binary")
+            (project_root / "docs" / "setup.md").write_text("Install steps.\n", encoding="utf-8")
+
+            docs = self.discover(project_root, "--max-doc-snippets", "2")["context"]["docs"]
+            self.assertEqual([entry["path"] for entry in docs], ["README.md", "docs/setup.md"])
+
     def test_complete_allows_omitted_planning_fields_and_research_still_runs(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             project_root = Path(tmp_dir)
@@ -328,6 +483,34 @@ class RunBrownfieldDocumentationTests(unittest.TestCase):
             self.assertEqual(owners.get(topic_one_entities[0]), topic_one.get("block_id"))
             self.assertEqual(owners.get(topic_two_entities[0]), topic_two.get("block_id"))
 
+    def test_complete_reads_utf8_payload_from_stdin(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir)
+            cadence_dir = project_root / ".cadence"
+            cadence_dir.mkdir(parents=True, exist_ok=True)
+            cadence_json = cadence_dir / "cadence.json"
+            cadence_json.write_text(json.dumps(build_doc_ready_state(), indent=4) + "\n", encoding="utf-8")
+            payload = build_brownfield_payload()
+            payload["objective"] = "Stabilise the café ordering platform"
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(RUN_DOC_SCRIPT),
+                    "--project-root",
+                    str(project_root),
+                    "complete",
+                    "--stdin",
+                ],
+                input=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+                capture_output=True,
+                check=False,
+            )
+
+            self.assertEqual(result.returncode, 0, msg=result.stderr or result.stdout)
+            response = json.loads(result.stdout)
+            self.assertEqual(response["ideation_summary"]["objective"], payload["objective"])
+
     def test_complete_persists_ideation_and_routes_to_research(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             project_root = Path(tmp_dir)
@@ -335,6 +518,7 @@ class RunBrownfieldDocumentationTests(unittest.TestCase):
             cadence_dir.mkdir(parents=True, exist_ok=True)
             cadence_json = cadence_dir / "cadence.json"
             cadence_json.write_text(json.dumps(build_doc_ready_state(), indent=4) + "\n", encoding="utf-8")
+            cadence_json.chmod(0o640)
 
             result = subprocess.run(
                 [
@@ -358,6 +542,7 @@ class RunBrownfieldDocumentationTests(unittest.TestCase):
             self.assertEqual(payload["mode"], "brownfield")
             self.assertEqual(payload.get("next_route", {}).get("skill_name"), "researcher")
 
+            self.assertEqual(cadence_json.stat().st_mode & 0o777, 0o640)
             updated = json.loads(cadence_json.read_text(encoding="utf-8"))
             state = updated.get("state", {})
             self.assertEqual(state.get("project-mode"), "brownfield")
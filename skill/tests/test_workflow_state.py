@@ -6,7 +6,12 @@ SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
-from workflow_state import default_data, reconcile_workflow_state, set_workflow_item_status
+from workflow_state import (
+    default_data,
+    reconcile_workflow_state,
+    set_workflow_item_status,
+    set_workflow_items,
+)
 
 
 def find_item(items: list[dict], item_id: str) -> dict | None:
@@ -152,6 +157,43 @@ class WorkflowStateStatusTests(unittest.TestCase):
         self.assertEqual(planner_task["status"], "skipped")
         self.assertEqual(updated["workflow"]["next_item"]["id"], "complete")
 
+    def test_bulk_item_updates_match_sequential_updates(self) -> None:
+        # Updates that interact through legacy flags and project-mode overrides.
+        cases = [
+            ("brownfield", [("task-scaffold", "blocked"), ("task-roadmap-planning", "blocked")]),
+            ("greenfield", [("task-brownfield-documentation", "pending"), ("task-scaffold", "complete")]),
+            ("greenfield", [("task-roadmap-planning", "skipped"), ("milestone-foundation", "blocked")]),
+        ]
+        for mode, updates in cases:
+            with self.subTest(mode=mode, updates=updates):
+                sequential = default_data()
+                sequential["state"]["project-mode"] = mode
+                for item_id, status in updates:
+                    sequential, _ = set_workflow_item_status(
+                        sequential,
+                        item_id=item_id,
+                        status=status,
+                        cadence_dir_exists=True,
+                    )
+
+                bulk = default_data()
+                bulk["state"]["project-mode"] = mode
+                bulk, found = set_workflow_items(bulk, updates, cadence_dir_exists=True)
+
+                self.assertTrue(found)
+                self.assertEqual(bulk, sequential)
+
+    def test_bulk_item_updates_are_all_or_nothing_and_reject_bad_status(self) -> None:
+        data, found = set_workflow_items(
+            default_data(),
+            [("task-scaffold", "complete"), ("task-missing", "complete")],
+            cadence_dir_exists=True,
+        )
+        self.assertFalse(found)
+        self.assertEqual(data, reconcile_workflow_state(default_data(), cadence_dir_exists=True))
+
+        with self.assertRaises(ValueError):
+            set_workflow_items(default_data(), [("task-scaffold", "done-ish")], cadence_dir_exists=True)
 
 if __name__ == "__main__":
     unittest.main()